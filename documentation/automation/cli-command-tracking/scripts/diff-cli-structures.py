@@ -14,7 +14,16 @@ Example:
 import sys
 import json
 from datetime import datetime, timezone
-from typing import Dict, List
+from typing import Dict, List, Optional
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is used otherwise
+    orjson = None
+
+# Fields compared one by one when an option or command has changed
+OPTION_FIELDS = ('short', 'long', 'value_name', 'help', 'default', 'possible_values')
+COMMAND_FIELDS = ('about', 'usage')
 
 
 def get_command_path(command: Dict, parent_path: str = "") -> str:
@@ -31,34 +40,52 @@ def flatten_commands(commands: List[Dict], parent_path: str = "") -> Dict[str, D
     Returns:
         Dict mapping command path to command data
     """
-    result = {}
-    
-    for cmd in commands:
-        cmd_path = get_command_path(cmd, parent_path)
+    pairs = []
+
+    # Walk the tree with an explicit stack (reversed so output keeps pre-order)
+    stack = [(cmd, parent_path) for cmd in reversed(commands)]
+    while stack:
+        cmd, parent = stack.pop()
+        cmd_path = get_command_path(cmd, parent)
         # Store command without subcommands to avoid recursion in comparisons
-        cmd_copy = cmd.copy()
-        subcommands = cmd_copy.pop('subcommands', [])
-        result[cmd_path] = cmd_copy
-        
-        # Recursively flatten subcommands
+        pairs.append((cmd_path, {k: v for k, v in cmd.items() if k != 'subcommands'}))
+
+        subcommands = cmd.get('subcommands')
         if subcommands:
-            result.update(flatten_commands(subcommands, cmd_path))
-    
-    return result
+            stack.extend((sub, cmd_path) for sub in reversed(subcommands))
+
+    # Build the mapping in one call once every entry is known
+    return dict(pairs)
+
+
+def option_key(opt: Dict) -> str:
+    """Key an option by its long flag, falling back to the short flag."""
+    long = opt.get('long')
+    return long if long else opt.get('short')
 
 
-def compare_options(old_opts: List[Dict], new_opts: List[Dict]) -> Dict:
+def option_signature(opt: Dict) -> tuple:
+    """Build a tuple of the comparable fields of an option."""
+    return tuple(map(opt.get, OPTION_FIELDS))
+
+
+def compare_options(old_opts: List[Dict], new_opts: List[Dict], command: str = "",
+                    breaking_out: Optional[List[Dict]] = None) -> Dict:
     """
     Compare two lists of options and detect changes.
     
+    If breaking_out is given, breaking changes for `command` are appended
+    to it as they are detected.
+    
     Returns dict with: added, removed, modified
     """
     # Create dicts keyed by long flag (or short if no long)
-    old_opts_dict = {opt.get('long') or opt.get('short'): opt for opt in old_opts}
-    new_opts_dict = {opt.get('long') or opt.get('short'): opt for opt in new_opts}
+    old_opts_dict = {option_key(opt): opt for opt in old_opts}
+    new_opts_dict = {option_key(opt): opt for opt in new_opts}
     
-    old_keys = set(old_opts_dict.keys())
-    new_keys = set(new_opts_dict.keys())
+    # dict key views support set operations directly
+    old_keys = old_opts_dict.keys()
+    new_keys = new_opts_dict.keys()
     
     added = []
     removed = []
@@ -70,39 +97,45 @@ def compare_options(old_opts: List[Dict], new_opts: List[Dict]) -> Dict:
     
     # Find removed options
     for key in old_keys - new_keys:
-        removed.append(old_opts_dict[key])
+        opt = old_opts_dict[key]
+        removed.append(opt)
+        
+        # Removed options are breaking
+        if breaking_out is not None:
+            opt_name = f"--{opt.get('long')}" if opt.get('long') else f"-{opt.get('short')}"
+            breaking_out.append({
+                'type': 'option_removed',
+                'command': command,
+                'option': opt_name,
+                'severity': 'high',
+                'description': f"Option '{opt_name}' removed from '{command}'"
+            })
     
     # Find modified options
     for key in old_keys & new_keys:
         old_opt = old_opts_dict[key]
         new_opt = new_opts_dict[key]
         
+        # Unchanged options are the common case; skip the per-field walk
+        if option_signature(old_opt) == option_signature(new_opt):
+            continue
+        
         changes = {}
         
         # Check each field for changes
-        if old_opt.get('short') != new_opt.get('short'):
-            changes['short'] = {'old': old_opt.get('short'), 'new': new_opt.get('short')}
-        
-        if old_opt.get('long') != new_opt.get('long'):
-            changes['long'] = {'old': old_opt.get('long'), 'new': new_opt.get('long')}
-        
-        if old_opt.get('value_name') != new_opt.get('value_name'):
-            changes['value_name'] = {'old': old_opt.get('value_name'), 'new': new_opt.get('value_name')}
-        
-        if old_opt.get('help') != new_opt.get('help'):
-            changes['help'] = {'old': old_opt.get('help'), 'new': new_opt.get('help')}
-        
-        if old_opt.get('default') != new_opt.get('default'):
-            changes['default'] = {'old': old_opt.get('default'), 'new': new_opt.get('default')}
-        
-        if old_opt.get('possible_values') != new_opt.get('possible_values'):
-            changes['possible_values'] = {'old': old_opt.get('possible_values'), 'new': new_opt.get('possible_values')}
+        for field in OPTION_FIELDS:
+            old_value = old_opt.get(field)
+            new_value = new_opt.get(field)
+            if old_value != new_value:
+                changes[field] = {'old': old_value, 'new': new_value}
         
         if changes:
             modified.append({
                 'option': key,
                 'changes': changes
             })
+            if breaking_out is not None:
+                breaking_out.extend(option_breaking_changes(command, key, changes))
     
     return {
         'added': added,
@@ -111,10 +144,55 @@ def compare_options(old_opts: List[Dict], new_opts: List[Dict]) -> Dict:
     }
 
 
-def compare_commands(old_cmds: Dict[str, Dict], new_cmds: Dict[str, Dict]) -> Dict:
+def option_breaking_changes(command: str, option: str, changes: Dict) -> List[Dict]:
+    """Identify likely breaking changes within a single modified option."""
+    breaking = []
+    
+    # Changed option flags are breaking
+    if 'short' in changes or 'long' in changes:
+        breaking.append({
+            'type': 'option_renamed',
+            'command': command,
+            'option': option,
+            'severity': 'high',
+            'description': f"Option flags changed in '{command}': {option}"
+        })
+    
+    # Changed default values might be breaking
+    if 'default' in changes:
+        breaking.append({
+            'type': 'default_changed',
+            'command': command,
+            'option': option,
+            'severity': 'medium',
+            'description': f"Default value changed for '{command} --{option}'"
+        })
+    
+    # Removed possible values are breaking
+    if 'possible_values' in changes:
+        old_vals = set(changes['possible_values']['old'] or [])
+        new_vals = set(changes['possible_values']['new'] or [])
+        removed_vals = old_vals - new_vals
+        if removed_vals:
+            breaking.append({
+                'type': 'enum_values_removed',
+                'command': command,
+                'option': option,
+                'severity': 'high',
+                'description': f"Possible values removed from '{command} --{option}': {', '.join(removed_vals)}"
+            })
+    
+    return breaking
+
+
+def compare_commands(old_cmds: Dict[str, Dict], new_cmds: Dict[str, Dict],
+                     breaking_out: Optional[List[Dict]] = None) -> Dict:
     """
     Compare two command dictionaries and detect changes.
     
+    If breaking_out is given, changes that are likely breaking are appended
+    to it during the same pass.
+    
     Returns dict with: added, removed, modified
     """
     old_paths = set(old_cmds.keys())
@@ -137,47 +215,68 @@ def compare_commands(old_cmds: Dict[str, Dict], new_cmds: Dict[str, Dict]) -> Di
             'command': path,
             'data': old_cmds[path]
         })
+        
+        # Removed commands are breaking
+        if breaking_out is not None:
+            breaking_out.append({
+                'type': 'command_removed',
+                'command': path,
+                'severity': 'high',
+                'description': f"Command '{path}' was removed"
+            })
     
     # Find modified commands
     for path in old_paths & new_paths:
         old_cmd = old_cmds[path]
         new_cmd = new_cmds[path]
         
+        # Most commands are unchanged between releases; a single C-level
+        # structural comparison is much cheaper than the per-field walk
+        if old_cmd == new_cmd:
+            continue
+        
         changes = {}
         
-        # Check about text
-        if old_cmd.get('about') != new_cmd.get('about'):
-            changes['about'] = {
-                'old': old_cmd.get('about'),
-                'new': new_cmd.get('about')
-            }
+        # Check about text and usage
+        for field in COMMAND_FIELDS:
+            old_value = old_cmd.get(field)
+            new_value = new_cmd.get(field)
+            if old_value != new_value:
+                changes[field] = {'old': old_value, 'new': new_value}
         
-        # Check aliases
-        old_aliases = set(old_cmd.get('aliases', []))
-        new_aliases = set(new_cmd.get('aliases', []))
+        # Check aliases (only a handful per command, so plain sorted lists
+        # and membership tests are cheaper than building sets)
+        old_aliases = sorted(old_cmd.get('aliases', []))
+        new_aliases = sorted(new_cmd.get('aliases', []))
         if old_aliases != new_aliases:
             changes['aliases'] = {
-                'old': sorted(old_aliases),
-                'new': sorted(new_aliases),
-                'added': sorted(new_aliases - old_aliases),
-                'removed': sorted(old_aliases - new_aliases)
-            }
-        
-        # Check usage
-        if old_cmd.get('usage') != new_cmd.get('usage'):
-            changes['usage'] = {
-                'old': old_cmd.get('usage'),
-                'new': new_cmd.get('usage')
+                'old': old_aliases,
+                'new': new_aliases,
+                'added': [a for a in new_aliases if a not in old_aliases],
+                'removed': [a for a in old_aliases if a not in new_aliases]
             }
         
         # Check options
         option_changes = compare_options(
             old_cmd.get('options', []),
-            new_cmd.get('options', [])
+            new_cmd.get('options', []),
+            path,
+            breaking_out
         )
         if any(option_changes.values()):
             changes['options'] = option_changes
         
+        # Removed aliases might be breaking (users might rely on them)
+        if breaking_out is not None and 'aliases' in changes:
+            for alias in changes['aliases']['removed']:
+                breaking_out.append({
+                    'type': 'alias_removed',
+                    'command': path,
+                    'alias': alias,
+                    'severity': 'medium',
+                    'description': f"Alias '{alias}' removed from '{path}'"
+                })
+        
         if changes:
             modified.append({
                 'command': path,
@@ -191,87 +290,58 @@ def compare_commands(old_cmds: Dict[str, Dict], new_cmds: Dict[str, Dict]) -> Di
     }
 
 
-def categorize_breaking_changes(changes: Dict) -> List[Dict]:
+class JsonStreamWriter:
     """
-    Identify changes that are likely breaking changes.
-    
-    Returns list of breaking change descriptions.
+    Write indented JSON to a binary stream one piece at a time.
+    
+    Dicts and lists are walked and written incrementally; each list item is
+    serialized on its own, so only one item's encoded bytes are held at once
+    instead of the whole document. The layout matches json.dumps(indent=2);
+    with orjson installed the bytes differ (non-ASCII text is written as UTF-8
+    rather than \\u-escaped, and floats like 1e20 are written as 1e20, not
+    1e+20), but the output parses to the same data.
     """
-    breaking = []
     
-    # Removed commands are breaking
-    for item in changes['commands']['removed']:
-        breaking.append({
-            'type': 'command_removed',
-            'command': item['command'],
-            'severity': 'high',
-            'description': f"Command '{item['command']}' was removed"
-        })
-    
-    # Check modified commands for breaking changes
-    for item in changes['commands']['modified']:
-        cmd = item['command']
-        cmd_changes = item['changes']
-        
-        # Removed options are breaking
-        if 'options' in cmd_changes:
-            for opt in cmd_changes['options']['removed']:
-                opt_name = f"--{opt.get('long')}" if opt.get('long') else f"-{opt.get('short')}"
-                breaking.append({
-                    'type': 'option_removed',
-                    'command': cmd,
-                    'option': opt_name,
-                    'severity': 'high',
-                    'description': f"Option '{opt_name}' removed from '{cmd}'"
-                })
-            
-            # Changed option flags are breaking
-            for mod in cmd_changes['options']['modified']:
-                if 'short' in mod['changes'] or 'long' in mod['changes']:
-                    breaking.append({
-                        'type': 'option_renamed',
-                        'command': cmd,
-                        'option': mod['option'],
-                        'severity': 'high',
-                        'description': f"Option flags changed in '{cmd}': {mod['option']}"
-                    })
-                
-                # Changed default values might be breaking
-                if 'default' in mod['changes']:
-                    breaking.append({
-                        'type': 'default_changed',
-                        'command': cmd,
-                        'option': mod['option'],
-                        'severity': 'medium',
-                        'description': f"Default value changed for '{cmd} --{mod['option']}'"
-                    })
-                
-                # Removed possible values are breaking
-                if 'possible_values' in mod['changes']:
-                    old_vals = set(mod['changes']['possible_values']['old'] or [])
-                    new_vals = set(mod['changes']['possible_values']['new'] or [])
-                    removed_vals = old_vals - new_vals
-                    if removed_vals:
-                        breaking.append({
-                            'type': 'enum_values_removed',
-                            'command': cmd,
-                            'option': mod['option'],
-                            'severity': 'high',
-                            'description': f"Possible values removed from '{cmd} --{mod['option']}': {', '.join(removed_vals)}"
-                        })
-        
-        # Removed aliases might be breaking (users might rely on them)
-        if 'aliases' in cmd_changes and cmd_changes['aliases']['removed']:
-            for alias in cmd_changes['aliases']['removed']:
-                breaking.append({
-                    'type': 'alias_removed',
-                    'command': cmd,
-                    'alias': alias,
-                    'severity': 'medium',
-                    'description': f"Alias '{alias}' removed from '{cmd}'"
-                })
-    
-    return breaking
+    def __init__(self, out, indent: int = 2):
+        self.out = out
+        self.indent = indent
+    
+    def _dumps(self, value) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(value, option=orjson.OPT_INDENT_2)
+        return json.dumps(value, indent=self.indent).encode('utf-8')
+    
+    def _newline(self, level: int) -> bytes:
+        return b'\n' + b' ' * (self.indent * level)
+    
+    def write(self, value, level: int = 0) -> None:
+        """Write a value nested `level` deep; containers are streamed."""
+        write = self.out.write
+        if isinstance(value, dict) and value:
+            write(b'{')
+            for i, (key, item) in enumerate(value.items()):
+                write((b',' if i else b'') + self._newline(level + 1))
+                write(self._dumps(key) + b': ')
+                self.write(item, level + 1)
+            write(self._newline(level) + b'}')
+        elif isinstance(value, list) and value:
+            write(b'[')
+            item_newline = self._newline(level + 1)
+            for i, item in enumerate(value):
+                write((b',' if i else b'') + item_newline)
+                # Items are serialized whole, then shifted to this depth
+                write(self._dumps(item).replace(b'\n', item_newline))
+            write(self._newline(level) + b']')
+        else:
+            write(self._dumps(value))
+
+
+def write_json(data: Dict) -> None:
+    """Stream data to stdout as indented JSON."""
+    sys.stdout.flush()
+    JsonStreamWriter(sys.stdout.buffer).write(data)
+    sys.stdout.buffer.write(b'\n')
+    sys.stdout.buffer.flush()
 
 
 def main():
@@ -300,18 +370,23 @@ def main():
     
     print(f"Comparing {old_data['version']} → {new_data['version']}...", file=sys.stderr)
     
-    # Flatten command structures
-    old_commands = flatten_commands(old_data['commands'])
-    new_commands = flatten_commands(new_data['commands'])
-    
-    print(f"Old version: {len(old_commands)} commands", file=sys.stderr)
-    print(f"New version: {len(new_commands)} commands", file=sys.stderr)
-    
-    # Compare commands
-    command_changes = compare_commands(old_commands, new_commands)
-    
-    # Categorize breaking changes
-    breaking_changes = categorize_breaking_changes({'commands': command_changes})
+    breaking_changes = []
+    
+    # Re-extracting the same release only changes metadata like extracted_at;
+    # when the command trees are equal there is nothing to flatten or diff
+    if old_data['commands'] == new_data['commands']:
+        print("Command trees are identical", file=sys.stderr)
+        command_changes = {'added': [], 'removed': [], 'modified': []}
+    else:
+        # Flatten command structures
+        old_commands = flatten_commands(old_data['commands'])
+        new_commands = flatten_commands(new_data['commands'])
+        
+        print(f"Old version: {len(old_commands)} commands", file=sys.stderr)
+        print(f"New version: {len(new_commands)} commands", file=sys.stderr)
+        
+        # Compare commands, collecting breaking changes in the same pass
+        command_changes = compare_commands(old_commands, new_commands, breaking_out=breaking_changes)
     
     # Determine if there are any changes
     has_changes = (
@@ -320,6 +395,11 @@ def main():
         len(command_changes['modified']) > 0
     )
     
+    # Count breaking changes by severity in a single pass
+    severity_counts = {'high': 0, 'medium': 0}
+    for change in breaking_changes:
+        severity_counts[change['severity']] += 1
+    
     # Build output
     now = datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
     
@@ -332,7 +412,8 @@ def main():
             'commands_added': len(command_changes['added']),
             'commands_removed': len(command_changes['removed']),
             'commands_modified': len(command_changes['modified']),
-            'breaking_changes': len([b for b in breaking_changes if b['severity'] == 'high'])
+            'breaking_changes': severity_counts['high'],
+            'breaking_changes_medium': severity_counts['medium']
         },
         'changes': {
             'commands': command_changes
@@ -341,7 +422,7 @@ def main():
     }
     
     # Output JSON
-    print(json.dumps(output, indent=2))
+    write_json(output)
     
     # Print summary to stderr
     print(f"\nSummary:", file=sys.stderr)
@@ -349,6 +430,7 @@ def main():
     print(f"  Commands removed: {output['summary']['commands_removed']}", file=sys.stderr)
     print(f"  Commands modified: {output['summary']['commands_modified']}", file=sys.stderr)
     print(f"  Breaking changes: {output['summary']['breaking_changes']}", file=sys.stderr)
+    print(f"  Possibly breaking changes: {output['summary']['breaking_changes_medium']}", file=sys.stderr)
 
 
 if __name__ == '__main__':
@@ -14,9 +14,15 @@ import subprocess
 import json
 import re
 import os
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Dict, List, Optional, Tuple
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is used otherwise
+    orjson = None
+
 
 def load_skip_commands() -> List[str]:
     """Load the list of commands to skip from config file."""
@@ -34,23 +40,39 @@ def load_skip_commands() -> List[str]:
 
 SKIP_COMMANDS = load_skip_commands()
 
+# Help invocations are subprocess-bound, so run many of them at once
+MAX_HELP_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Patterns used while parsing help output, compiled once at import time
+USAGE_RE = re.compile(r'^Usage:\s*(.+)$', re.MULTILINE)
+ALIASES_RE = re.compile(r'\[aliases?:\s*([^\]]+)\]')
+OPTIONS_SECTION_RE = re.compile(r'^Options:\s*\n(.+?)(?=^Commands:\s*$|\Z)', re.MULTILINE | re.DOTALL)
+INLINE_HELP_SPLIT_RE = re.compile(r'\s{2,}')
+SHORT_FLAG_RE = re.compile(r'-([a-zA-Z])\b')
+LONG_FLAG_RE = re.compile(r'--([a-z][a-z0-9-]*)')
+VALUE_NAME_RE = re.compile(r'<([^>]+)>')
+DEFAULT_RE = re.compile(r'\[default:\s*([^\]]+)\]')
+POSSIBLE_VALUES_RE = re.compile(r'\[possible values:\s*([^\]]+)\]')
+COMMANDS_SECTION_RE = re.compile(r'^Commands:\s*$(.+?)(?:^Options:|\Z)', re.MULTILINE | re.DOTALL)
+VERSION_RE = re.compile(r'(\d+\.\d+\.\d+)')
 
-def run_help_command(binary_path: str, command_path: List[str], short: bool = False) -> str:
+
+def run_help_command(binary_path: str, command_path: Tuple[str, ...], short: bool = False) -> str:
     """
     Run --help or -h on a command and return the output.
     
     Args:
         binary_path: Path to goose binary
-        command_path: List of command parts (e.g., ['session', 'list'])
+        command_path: Tuple of command parts (e.g., ('session', 'list'))
         short: If True, use -h instead of --help
         
     Returns:
         Help text output
     """
-    cmd = [binary_path] + command_path + (['-h'] if short else ['--help'])
+    cmd = [binary_path, *command_path, '-h' if short else '--help']
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-        return result.stdout
+        result = subprocess.run(cmd, stdin=subprocess.DEVNULL, capture_output=True, timeout=10)
+        return result.stdout.decode('utf-8', errors='replace')
     except subprocess.TimeoutExpired:
         print(f"Warning: Command timed out: {' '.join(cmd)}", file=sys.stderr)
         return ""
@@ -61,7 +83,7 @@ def run_help_command(binary_path: str, command_path: List[str], short: bool = Fa
 
 def parse_usage_line(help_text: str) -> Optional[str]:
     """Extract the usage line from help text."""
-    match = re.search(r'^Usage:\s*(.+)$', help_text, re.MULTILINE)
+    match = USAGE_RE.search(help_text)
     return match.group(1).strip() if match else None
 
 
@@ -89,10 +111,10 @@ def parse_about(help_text: str) -> str:
 def parse_aliases(help_text: str) -> List[str]:
     """Extract command aliases from help text."""
     # Look for "[aliases: x, y]" pattern in the first few lines
-    match = re.search(r'\[aliases?:\s*([^\]]+)\]', help_text[:500])
+    match = ALIASES_RE.search(help_text, 0, 500)
     if match:
         aliases_str = match.group(1)
-        return [a.strip() for a in aliases_str.split(',')]
+        return [sys.intern(a.strip()) for a in aliases_str.split(',')]
     return []
 
 
@@ -106,19 +128,13 @@ def parse_options(help_text: str) -> List[Dict]:
     
     # Find the Options: section - goes until Commands: section or end of text
     # Note: clap help has blank lines between options, so we can't stop at ^$
-    options_match = re.search(r'^Options:\s*\n(.+?)(?=^Commands:\s*$|\Z)', 
-                             help_text, re.MULTILINE | re.DOTALL)
+    options_match = OPTIONS_SECTION_RE.search(help_text)
     if not options_match:
         return options
     
     options_text = options_match.group(1)
     
-    # Split into individual option blocks
-    # Each option starts with whitespace followed by a dash (short or long flag)
-    # Use lookahead to split at lines that start a new option
-    option_blocks = re.split(r'\n(?=\s+-)', options_text)
-    
-    for block in option_blocks:
+    for block in split_option_blocks(options_text):
         block = block.strip()
         if not block or not block.startswith('-'):
             continue
@@ -130,8 +146,38 @@ def parse_options(help_text: str) -> List[Dict]:
     return options
 
 
+def split_option_blocks(options_text: str) -> List[str]:
+    """
+    Split the Options: section into one text block per option.
+    
+    A new block starts at an indented line beginning with a dash (short or
+    long flag), or at a dash line directly after a blank line.
+    """
+    blocks = []
+    current = []
+    prev_blank = False
+    
+    for line in options_text.split('\n'):
+        stripped = line.lstrip()
+        if current and stripped.startswith('-') and (prev_blank or line[:1].isspace()):
+            blocks.append('\n'.join(current))
+            current = []
+        current.append(line)
+        prev_blank = not stripped
+    
+    if current:
+        blocks.append('\n'.join(current))
+    
+    return blocks
+
+
 def parse_option_block(block: str) -> Optional[Dict]:
-    """Parse a single option block into structured data."""
+    """
+    Parse a single option block into structured data.
+    
+    Flag names, value names and possible values repeat across many commands,
+    so they are interned to share one string object per distinct value.
+    """
     lines = block.split('\n')
     if not lines:
         return None
@@ -142,25 +188,25 @@ def parse_option_block(block: str) -> Optional[Dict]:
 
     # Split on 2+ spaces to separate flags from inline help text.
     # Example: "-o, --output <FILE>  Write output to file"
-    parts = re.split(r'\s{2,}', first_line, maxsplit=1)
+    parts = INLINE_HELP_SPLIT_RE.split(first_line, maxsplit=1)
     flags_part = parts[0]
     if len(parts) == 2:
         inline_help = parts[1].strip() or None
     
     # Extract short flag (e.g., -f)
-    short_match = re.search(r'-([a-zA-Z])\b', flags_part)
-    short = short_match.group(1) if short_match else None
+    short_match = SHORT_FLAG_RE.search(flags_part)
+    short = sys.intern(short_match.group(1)) if short_match else None
     
     # Extract long flag (e.g., --format)
-    long_match = re.search(r'--([a-z][a-z0-9-]*)', flags_part)
-    long = long_match.group(1) if long_match else None
+    long_match = LONG_FLAG_RE.search(flags_part)
+    long = sys.intern(long_match.group(1)) if long_match else None
     
     # Extract value_name (e.g., <FORMAT>)
-    value_name_match = re.search(r'<([^>]+)>', flags_part)
-    value_name = value_name_match.group(1) if value_name_match else None
+    value_name_match = VALUE_NAME_RE.search(flags_part)
+    value_name = sys.intern(value_name_match.group(1)) if value_name_match else None
     
-    # Collect help text from subsequent indented lines
-    help_lines = []
+    # Collect help text from subsequent indented lines, after any inline help
+    help_lines = [inline_help] if inline_help else []
     for line in lines[1:]:
         line = line.strip()
         if line and not line.startswith('['):
@@ -169,29 +215,26 @@ def parse_option_block(block: str) -> Optional[Dict]:
             # This might be [default: ...] or [possible values: ...]
             break
     
-    help_text = ' '.join(help_lines)
-
-    if inline_help:
-        help_text = f"{inline_help} {help_text}".strip() if help_text else inline_help
+    help_text = ' '.join(help_lines) or None
     
     # Extract default value
     default = None
-    default_match = re.search(r'\[default:\s*([^\]]+)\]', block)
+    default_match = DEFAULT_RE.search(block)
     if default_match:
         default = default_match.group(1).strip()
     
     # Extract possible values
     possible_values = None
-    possible_match = re.search(r'\[possible values:\s*([^\]]+)\]', block)
+    possible_match = POSSIBLE_VALUES_RE.search(block)
     if possible_match:
         values_str = possible_match.group(1)
-        possible_values = [v.strip() for v in values_str.split(',')]
+        possible_values = [sys.intern(v.strip()) for v in values_str.split(',')]
     
     return {
         'short': short,
         'long': long,
         'value_name': value_name,
-        'help': help_text if help_text else None,
+        'help': help_text,
         'default': default,
         'possible_values': possible_values
     }
@@ -207,8 +250,7 @@ def parse_subcommands(help_text: str) -> List[Tuple[str, List[str]]]:
     commands = []
     
     # Find the Commands: section
-    commands_match = re.search(r'^Commands:\s*$(.+?)(?:^Options:|\Z)', 
-                              help_text, re.MULTILINE | re.DOTALL)
+    commands_match = COMMANDS_SECTION_RE.search(help_text)
     if not commands_match:
         return commands
     
@@ -229,73 +271,108 @@ def parse_subcommands(help_text: str) -> List[Tuple[str, List[str]]]:
         # Extract command name (first word)
         parts = line.split()
         if parts and not parts[0].startswith('-'):
-            command_name = parts[0]
+            command_name = sys.intern(parts[0])
             # Skip "help" command as it's auto-generated
             if command_name == 'help':
                 continue
             
             # Extract aliases from [aliases: x, y] pattern
             aliases = []
-            alias_match = re.search(r'\[aliases?:\s*([^\]]+)\]', line)
+            alias_match = ALIASES_RE.search(line)
             if alias_match:
                 aliases_str = alias_match.group(1)
-                aliases = [a.strip() for a in aliases_str.split(',')]
+                aliases = [sys.intern(a.strip()) for a in aliases_str.split(',')]
             
             commands.append((command_name, aliases))
     
     return commands
 
 
-def extract_command_structure(binary_path: str, command_path: List[str] = None, 
-                            parent_aliases: List[str] = None) -> Dict:
+def parse_help(help_text: str) -> Dict:
+    """
+    Parse everything extract_command_structure needs from one help text.
+    
+    Returns dict with: about, aliases, usage, options, subcommands (as
+    (name, aliases) tuples from the Commands: section)
+    """
+    return {
+        'about': parse_about(help_text),
+        'aliases': parse_aliases(help_text),
+        'usage': parse_usage_line(help_text),
+        'options': parse_options(help_text),
+        'subcommands': parse_subcommands(help_text)
+    }
+
+
+def fetch_and_parse_help(binary_path: str, command_path: Tuple[str, ...]) -> Optional[Dict]:
+    """Run --help for a command and parse it, or return None if there was no output."""
+    help_text = run_help_command(binary_path, command_path, short=False)
+    return parse_help(help_text) if help_text else None
+
+
+def extract_command_structure(binary_path: str, command_path: Tuple[str, ...] = (), 
+                            parent_aliases: List[str] = None,
+                            executor: Optional[Executor] = None,
+                            parsed_future: Optional[Future] = None) -> Dict:
     """
     Recursively extract command structure starting from a command path.
     
     Args:
         binary_path: Path to goose binary
-        command_path: Current command path (e.g., ['session', 'list'])
+        command_path: Current command path (e.g., ('session', 'list'))
         parent_aliases: Aliases passed from parent (since they appear in parent's help)
+        executor: Pool used to fetch and parse subcommand help concurrently
+        parsed_future: Already-submitted fetch_and_parse_help call for this command
         
     Returns:
         Dict with command structure
     """
-    if command_path is None:
-        command_path = []
-    
-    # Get both short and long help
-    help_text_long = run_help_command(binary_path, command_path, short=False)
-    
-    if not help_text_long:
+    if executor is None:
+        with ThreadPoolExecutor(max_workers=MAX_HELP_WORKERS) as pool:
+            return extract_command_structure(binary_path, command_path, parent_aliases,
+                                             pool, parsed_future)
+    
+    # Get parsed long help
+    if parsed_future is not None:
+        parsed = parsed_future.result()
+    else:
+        parsed = fetch_and_parse_help(binary_path, command_path)
+    
+    if not parsed:
         return None
     
     # Parse command info
     command_name = command_path[-1] if command_path else "goose"
-    about = parse_about(help_text_long)
-    # Use parent_aliases if provided, otherwise try to parse from own help
-    aliases = parent_aliases if parent_aliases is not None else parse_aliases(help_text_long)
-    usage = parse_usage_line(help_text_long)
-    options = parse_options(help_text_long)
+    # Use parent_aliases if provided, otherwise use the ones from own help
+    aliases = parent_aliases if parent_aliases is not None else parsed['aliases']
     
     # Get subcommands with their aliases and recursively process them
-    subcommand_info = parse_subcommands(help_text_long)
     subcommands = []
+    pending = []
     
-    for subcommand_name, subcommand_aliases in subcommand_info:
+    # Start every sibling's help up front; workers parse each help text
+    # while the others are still waiting on their subprocess
+    for subcommand_name, subcommand_aliases in parsed['subcommands']:
         # Skip commands in the skip list
         if subcommand_name in SKIP_COMMANDS:
             print(f"Skipping command: {subcommand_name}", file=sys.stderr)
             continue
-        sub_path = command_path + [subcommand_name]
-        sub_structure = extract_command_structure(binary_path, sub_path, subcommand_aliases)
+        sub_path = command_path + (subcommand_name,)
+        future = executor.submit(fetch_and_parse_help, binary_path, sub_path)
+        pending.append((sub_path, subcommand_aliases, future))
+    
+    for sub_path, subcommand_aliases, future in pending:
+        sub_structure = extract_command_structure(binary_path, sub_path, subcommand_aliases,
+                                                  executor, future)
         if sub_structure:
             subcommands.append(sub_structure)
     
     return {
         'name': command_name,
-        'about': about,
+        'about': parsed['about'],
         'aliases': aliases,
-        'usage': usage,
-        'options': options,
+        'usage': parsed['usage'],
+        'options': parsed['options'],
         'subcommands': subcommands
     }
 
@@ -303,16 +380,27 @@ def extract_command_structure(binary_path: str, command_path: List[str] = None,
 def extract_version(binary_path: str) -> str:
     """Extract version from goose --version."""
     try:
-        result = subprocess.run([binary_path, '--version'], 
-                              capture_output=True, text=True, timeout=5)
+        result = subprocess.run([binary_path, '--version'], stdin=subprocess.DEVNULL,
+                              capture_output=True, timeout=5)
         # Output is typically "goose 1.15.0" or similar
-        version_match = re.search(r'(\d+\.\d+\.\d+)', result.stdout)
+        version_match = VERSION_RE.search(result.stdout.decode('utf-8', errors='replace'))
         return version_match.group(1) if version_match else "unknown"
     except Exception as e:
         print(f"Warning: Could not extract version: {e}", file=sys.stderr)
         return "unknown"
 
 
+def write_json(data: Dict) -> None:
+    """Write data to stdout as indented JSON, using orjson when available."""
+    if orjson is not None:
+        sys.stdout.flush()
+        sys.stdout.buffer.write(orjson.dumps(data, option=orjson.OPT_INDENT_2) + b'\n')
+        sys.stdout.buffer.flush()
+    else:
+        json.dump(data, sys.stdout, indent=2)
+        sys.stdout.write('\n')
+
+
 def main():
     if len(sys.argv) < 2:
         print("Usage: extract-cli-structure.py <goose-binary-path> [source-version]", file=sys.stderr)
@@ -324,8 +412,9 @@ def main():
     
     # Verify binary exists and is executable
     try:
-        result = subprocess.run([binary_path, '--version'], 
-                              capture_output=True, timeout=5)
+        # Only the exit status matters here, so discard the output
+        result = subprocess.run([binary_path, '--version'], stdin=subprocess.DEVNULL,
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=5)
         if result.returncode != 0:
             print(f"Error: {binary_path} is not a valid goose binary", file=sys.stderr)
             sys.exit(1)
@@ -340,7 +429,7 @@ def main():
     print(f"Version: {version}", file=sys.stderr)
     
     # Extract root command structure (recursively includes all subcommands)
-    root_structure = extract_command_structure(binary_path, [])
+    root_structure = extract_command_structure(binary_path, ())
     
     # Build output JSON
     # Use timezone-aware UTC datetime (Python 3.7+)
@@ -355,7 +444,7 @@ def main():
     }
     
     # Output JSON
-    print(json.dumps(output, indent=2))
+    write_json(output)
     print("Extraction complete!", file=sys.stderr)
 
 
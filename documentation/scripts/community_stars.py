@@ -17,20 +17,42 @@ Usage:
     python3 community_stars.py "November 2025"
     python3 community_stars.py "November 1, 2025 - November 17, 2025"
     python3 community_stars.py "2025-11-01 - 2025-11-17"
+    python3 community_stars.py --stars-only "November 2025"
 
 Requirements:
+    - Python 3.10+
     - Internet connection (to fetch GitHub data)
     - Team list file at documentation/scripts/community_stars_teams.txt
+    - Optional: GITHUB_TOKEN (or GH_TOKEN) to raise the GitHub API rate limit
+      and batch org checks through GraphQL
 """
 
+import http.client
 import json
+import os
+import random
 import re
 import sys
+import urllib.error
 import urllib.request
 from datetime import datetime
+import bisect
 import calendar
+import heapq
+from dataclasses import dataclass
+from operator import attrgetter, itemgetter
+from typing import Optional
 from pathlib import Path
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError
+    load_json_bytes = orjson.loads
+except ImportError:  # optional speedup for the large contributors payload
+    load_json_bytes = json.loads
 
 # GitHub URL for team list file
 TEAMS_FILE_URL = "https://raw.githubusercontent.com/block/goose/main/documentation/scripts/community_stars_teams.txt"
@@ -39,45 +61,264 @@ LOCAL_TEAMS_FILE = Path(__file__).parent / "community_stars_teams.txt"
 # Block-related organizations to check
 BLOCK_ORGS = {'square', 'block', 'squareup', 'block-ghc', 'cashapp'}
 
+# Block-related keywords to look for in a user's company field
+BLOCK_COMPANY_KEYWORDS = ['block', 'square', 'cash app', 'cashapp', 'tidal']
+
+# A token raises the API rate limit from 60 to 5000 requests/hour, and lets
+# org checks be batched into GraphQL queries (which require auth)
+GITHUB_TOKEN = os.environ.get('GITHUB_TOKEN') or os.environ.get('GH_TOKEN')
+GITHUB_API_HEADERS = {'Accept': 'application/vnd.github+json'}
+if GITHUB_TOKEN:
+    GITHUB_API_HEADERS['Authorization'] = f'Bearer {GITHUB_TOKEN}'
+GITHUB_API_HOST = "api.github.com"
+GITHUB_GRAPHQL_PATH = "/graphql"
+GRAPHQL_BATCH_SIZE = 50
+
+# Date input formats accepted by parse_date_range
+MONTH_YEAR_RE = re.compile(
+    r'^(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{4})$',
+    re.IGNORECASE
+)
+DATE_FORMATS = ("%B %d, %Y", "%b %d, %Y", "%Y-%m-%d")
+
+# Ranking key for contributor stats
+SCORE = attrgetter('score')
+
+# Field accessors for the weekly buckets in GitHub's stats/contributors data
+WEEK_TIMESTAMP = itemgetter('w')
+WEEK_COMMITS = itemgetter('c')
+WEEK_ADDITIONS = itemgetter('a')
+WEEK_DELETIONS = itemgetter('d')
+
+# Section headers in the team lists file, mapped to the section they start
+SECTION_RE = re.compile(r'# (Goose Maintainers|Block, non-goose|External, goose|Bots)')
+SECTION_NAMES = {
+    'Goose Maintainers': 'goose_maintainers',
+    'Block, non-goose': 'block_non_goose',
+    'External, goose': 'external_goose',
+    'Bots': 'bots',
+}
+
+# Team list sections left out of the rankings entirely
+EXCLUDED_CATEGORIES = frozenset({'goose_maintainers', 'external_goose', 'bots'})
+
+# Categories assigned to every counted contributor; interned so the per-user
+# comparisons are pointer checks
+BLOCK_NON_GOOSE = sys.intern('block_non_goose')
+EXTERNAL = sys.intern('external')
+
+# Org check results persist between runs so only new contributors hit the API
+BLOCK_EMPLOYEE_CACHE_FILE = Path('/tmp/block_employee_cache.json')
+BLOCK_EMPLOYEE_CACHE_TTL = 7 * 24 * 60 * 60  # 7 days
+
+# Org checks run concurrently, but API requests are still spaced out
+# to stay under GitHub's secondary rate limits
+ORG_CHECK_WORKERS = 8
+GITHUB_REQUEST_INTERVAL = 0.1  # seconds between request starts
+
+# Backoff for retried stats requests: doubles from 2s, never sleeps longer than this
+MAX_RETRY_DELAY = 60
+
+class RateLimiter:
+    """Space out calls across threads to at most one per interval."""
+    
+    def __init__(self, interval):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+    
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+github_rate_limiter = RateLimiter(GITHUB_REQUEST_INTERVAL)
+
+# One keep-alive connection per thread, so org checks don't pay a TLS handshake each
+_github_connections = threading.local()
+
+def github_api_request(method, path, body=None, headers=None):
+    """Send a request to the GitHub API over this thread's persistent connection.
+    
+    Returns (status, body bytes). A connection the server has since closed is
+    reopened and the request retried once.
+    """
+    headers = {'User-Agent': 'goose-community-stars', **GITHUB_API_HEADERS, **(headers or {})}
+    for attempt in range(2):
+        conn = getattr(_github_connections, 'conn', None)
+        if conn is None:
+            conn = http.client.HTTPSConnection(GITHUB_API_HOST, timeout=30)
+            _github_connections.conn = conn
+        try:
+            conn.request(method, path, body=body, headers=headers)
+            response = conn.getresponse()
+            # Always drain the body so the connection can be reused
+            return response.status, response.read()
+        except (http.client.HTTPException, OSError):
+            conn.close()
+            _github_connections.conn = None
+            if attempt == 1:
+                raise
+
+@dataclass
+class ContributorStats:
+    """A contributor's activity totals for the report period."""
+    # Slots keep each record small (no per-instance __dict__)
+    __slots__ = ('username', 'category', 'commits', 'additions', 'deletions', 'total_lines', 'score')
+    
+    username: str
+    category: Optional[str]
+    commits: int
+    additions: int
+    deletions: int
+    total_lines: int
+    score: int
+
 def is_block_employee(username):
     """Check if a user is a Block employee by checking their profile and org memberships.
     
     Makes a single API call to get user profile (includes company field),
-    then only calls orgs endpoint if company field doesn't match.
+    then only checks org memberships if company field doesn't match: one
+    HEAD probe per Block org with a token, or a single orgs listing without
+    one (unauthenticated requests are limited to 60 an hour).
+    
+    Returns None if the check could not be completed (rate limit, network error, etc.).
     """
     try:
         # First check the user's profile (single API call)
-        url = f"https://api.github.com/users/{username}"
-        with urllib.request.urlopen(url) as response:
-            user_data = json.loads(response.read().decode('utf-8'))
+        github_rate_limiter.wait()
+        status, body = github_api_request('GET', f"/users/{username}")
+        if status != 200:
+            raise RuntimeError(f"GitHub API returned {status} for user {username}")
+        user_data = json.loads(body)
         
         # Check company field first (no additional API call needed)
-        company = user_data.get('company', '').lower() if user_data.get('company') else ''
-        if company:
-            # Check for Block-related keywords in company field
-            block_keywords = ['block', 'square', 'cash app', 'cashapp', 'tidal']
-            if any(keyword in company for keyword in block_keywords):
-                return True
-        
-        # Only check orgs if company field didn't match (second API call only when needed)
-        url = f"https://api.github.com/users/{username}/orgs"
-        with urllib.request.urlopen(url) as response:
-            orgs = json.loads(response.read().decode('utf-8'))
-            
-        # Check if any org matches Block orgs (case-insensitive)
-        user_orgs = {org['login'].lower() for org in orgs}
-        if user_orgs & BLOCK_ORGS:
+        if is_block_company(user_data.get('company')):
             return True
-                
-        return False
+        
+        # Only check orgs if company field didn't match (more API calls only when needed)
+        if GITHUB_TOKEN:
+            return any(is_public_org_member(org, username) for org in BLOCK_ORGS)
+        
+        # Without a token, one orgs listing costs a single request of the
+        # small quota however many Block orgs there are
+        github_rate_limiter.wait()
+        status, body = github_api_request('GET', f"/users/{username}/orgs")
+        if status != 200:
+            raise RuntimeError(f"GitHub API returned {status} for orgs of {username}")
+        user_orgs = {org['login'].lower() for org in json.loads(body)}
+        return bool(user_orgs & BLOCK_ORGS)
         
     except Exception as e:
-        # If we can't check (rate limit, network error, etc.), return False
-        # This means we'll default to treating them as external
-        return False
+        # If we can't check (rate limit, network error, etc.), return None
+        # Callers treat this as external, but it is not cached across runs
+        return None
+
+def is_public_org_member(org, username):
+    """Check public membership of one org with a HEAD request (204 = member, 404 = not).
+    
+    Only the status code is needed, so no response body is transferred.
+    Other HTTP errors are raised to the caller.
+    """
+    github_rate_limiter.wait()
+    status, _ = github_api_request('HEAD', f"/orgs/{org}/public_members/{username}")
+    if status in (204, 404):
+        return status == 204
+    raise RuntimeError(f"GitHub API returned {status} checking {org} membership of {username}")
+
+def is_block_company(company):
+    """Check whether a profile's company field mentions a Block-related keyword."""
+    company = company.lower() if company else ''
+    return any(keyword in company for keyword in BLOCK_COMPANY_KEYWORDS)
+
+def check_block_employees_graphql(usernames):
+    """Check many users at once with aliased GitHub GraphQL queries.
+    
+    Sends one request per GRAPHQL_BATCH_SIZE users instead of up to two REST
+    calls per user. Requires GITHUB_TOKEN.
+    
+    Returns dict mapping each username to True/False, or None if it could not be checked.
+    """
+    results = {}
+    for i in range(0, len(usernames), GRAPHQL_BATCH_SIZE):
+        batch = usernames[i:i + GRAPHQL_BATCH_SIZE]
+        fields = ' '.join(
+            f'u{j}: user(login: {json.dumps(username)}) '
+            '{ company organizations(first: 100) { nodes { login } } }'
+            for j, username in enumerate(batch)
+        )
+        try:
+            github_rate_limiter.wait()
+            status, body = github_api_request(
+                'POST',
+                GITHUB_GRAPHQL_PATH,
+                body=json.dumps({'query': f'query {{ {fields} }}'}).encode('utf-8'),
+                headers={'Content-Type': 'application/json'}
+            )
+            if status != 200:
+                raise RuntimeError(f"GitHub GraphQL API returned {status}")
+            # Unknown logins come back as null users alongside an 'errors' list
+            data = json.loads(body).get('data') or {}
+        except Exception as e:
+            print(f"Warning: GraphQL org check failed: {e}", file=sys.stderr)
+            data = {}
+        
+        for j, username in enumerate(batch):
+            user = data.get(f'u{j}')
+            if user is None:
+                results[username] = None
+                continue
+            user_orgs = {org['login'].lower() for org in user['organizations']['nodes']}
+            results[username] = is_block_company(user.get('company')) or bool(user_orgs & BLOCK_ORGS)
+    
+    return results
+
+def load_block_employee_cache():
+    """Load org check results from previous runs, dropping entries older than the TTL."""
+    try:
+        with open(BLOCK_EMPLOYEE_CACHE_FILE, 'r') as f:
+            entries = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    
+    now = time.time()
+    return {
+        username: entry for username, entry in entries.items()
+        if isinstance(entry, dict) and now - entry.get('ts', 0) < BLOCK_EMPLOYEE_CACHE_TTL
+    }
+
+def save_block_employee_cache(entries):
+    """Persist org check results for the next run."""
+    try:
+        with open(BLOCK_EMPLOYEE_CACHE_FILE, 'w') as f:
+            json.dump(entries, f)
+    except OSError as e:
+        print(f"Warning: Could not write {BLOCK_EMPLOYEE_CACHE_FILE}: {e}", file=sys.stderr)
+
+def retry_wait_seconds(error, delay):
+    """Work out how long to sleep before retrying a GitHub request.
+    
+    Honors Retry-After (or X-RateLimit-Reset once the quota is used up) when it
+    asks for longer than the backoff delay, capped at MAX_RETRY_DELAY, plus jitter.
+    """
+    headers = getattr(error, 'headers', None)
+    if headers:
+        retry_after = headers.get('Retry-After')
+        rate_limit_reset = headers.get('X-RateLimit-Reset')
+        if retry_after and retry_after.isdigit():
+            delay = max(delay, int(retry_after))
+        elif headers.get('X-RateLimit-Remaining') == '0' and rate_limit_reset and rate_limit_reset.isdigit():
+            delay = max(delay, int(rate_limit_reset) - time.time())
+    return min(delay, MAX_RETRY_DELAY) + random.uniform(0, 1)
 
 def load_team_lists():
-    """Load and parse team lists from file (local or GitHub)."""
+    """Load and parse team lists from file (local or GitHub).
+    
+    Returns a dict mapping each listed username to its section name.
+    """
     content = None
     
     # Try local file first
@@ -95,10 +336,7 @@ def load_team_lists():
             sys.exit(1)
     
     # Parse the team lists
-    goose_maintainers = set()
-    block_non_goose = set()
-    external_goose = set()
-    bots = set()
+    sections = {section: set() for section in SECTION_NAMES.values()}
     
     current_section = None
     for line in content.split('\n'):
@@ -107,36 +345,29 @@ def load_team_lists():
         # Skip comments and empty lines
         if not line or line.startswith('#'):
             # Check for section headers in comments
-            if '# Goose Maintainers' in line:
-                current_section = 'goose_maintainers'
-            elif '# Block, non-goose' in line:
-                current_section = 'block_non_goose'
-            elif '# External, goose' in line:
-                current_section = 'external_goose'
-            elif '# Bots' in line:
-                current_section = 'bots'
+            match = SECTION_RE.search(line)
+            if match:
+                current_section = sections[SECTION_NAMES[match.group(1)]]
             continue
         
         # Add username to appropriate set (lowercase for case-insensitive matching)
-        username = line.lower()
-        if current_section == 'goose_maintainers':
-            goose_maintainers.add(username)
-        elif current_section == 'block_non_goose':
-            block_non_goose.add(username)
-        elif current_section == 'external_goose':
-            external_goose.add(username)
-        elif current_section == 'bots':
-            bots.add(username)
+        if current_section is not None:
+            current_section.add(line.lower())
     
-    return goose_maintainers, block_non_goose, external_goose, bots
+    # Single lookup of each listed user's section; excluded sections win over
+    # block_non_goose if a user is listed more than once
+    category_of = dict.fromkeys(sections['block_non_goose'], BLOCK_NON_GOOSE)
+    for section in ('goose_maintainers', 'external_goose', 'bots'):
+        category_of.update(dict.fromkeys(sections[section], section))
+    
+    return category_of
 
 def parse_date_range(date_input):
     """Parse various date input formats and return start/end timestamps."""
     date_input = date_input.strip()
     
     # Format: "Month YYYY" (e.g., "November 2025")
-    month_year_pattern = r'^(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{4})$'
-    match = re.match(month_year_pattern, date_input, re.IGNORECASE)
+    match = MONTH_YEAR_RE.match(date_input)
     if match:
         month_name = match.group(1).capitalize()
         year = int(match.group(2))
@@ -150,11 +381,10 @@ def parse_date_range(date_input):
         separator = ' - ' if ' - ' in date_input else ' to '
         parts = date_input.split(separator)
         if len(parts) == 2:
-            date_formats = ["%B %d, %Y", "%b %d, %Y", "%Y-%m-%d"]
             start_date = None
             end_date = None
             
-            for fmt in date_formats:
+            for fmt in DATE_FORMATS:
                 try:
                     start_date = datetime.strptime(parts[0].strip(), fmt)
                     end_date = datetime.strptime(parts[1].strip(), fmt)
@@ -170,15 +400,21 @@ def parse_date_range(date_input):
 
 def main():
     # Parse command line arguments
-    if len(sys.argv) < 2:
-        print("Usage: python3 community_stars.py 'date_range'")
+    args = sys.argv[1:]
+    # --stars-only prints just the top 5 lists, without the full leaderboard
+    stars_only = '--stars-only' in args
+    if stars_only:
+        args.remove('--stars-only')
+    if len(args) < 1:
+        print("Usage: python3 community_stars.py [--stars-only] 'date_range'")
         print("Examples:")
         print("  python3 community_stars.py 'November 2025'")
         print("  python3 community_stars.py 'November 1, 2025 - November 17, 2025'")
         print("  python3 community_stars.py '2025-11-01 - 2025-11-17'")
+        print("  python3 community_stars.py --stars-only 'November 2025'")
         sys.exit(1)
 
-    date_input = sys.argv[1]
+    date_input = args[0]
     try:
         start_timestamp, end_timestamp, display_period = parse_date_range(date_input)
         start_date = datetime.fromtimestamp(start_timestamp)
@@ -188,16 +424,18 @@ def main():
         sys.exit(1)
 
     # Load team lists
-    goose_maintainers, block_non_goose, external_goose, bots = load_team_lists()
+    category_of = load_team_lists()
 
     # Load GitHub data
     github_data_file = '/tmp/github_contributors.json'
+    github_etag_file = github_data_file + '.etag'
     contributors_data = None
+    etag = None
     
     # Try to load existing file first
     try:
-        with open(github_data_file, 'r') as f:
-            contributors_data = json.load(f)
+        with open(github_data_file, 'rb') as f:
+            contributors_data = load_json_bytes(f.read())
             
         # Validate the data is not empty or invalid
         if not contributors_data or not isinstance(contributors_data, list) or len(contributors_data) == 0:
@@ -207,40 +445,72 @@ def main():
         print(f"GitHub data file not found or invalid. Fetching fresh data...", file=sys.stderr)
         contributors_data = None
     
+    # Cached data saved with an ETag is revalidated with a conditional request;
+    # GitHub answers 304 with no body when nothing changed
+    if contributors_data is not None:
+        try:
+            with open(github_etag_file, 'r') as f:
+                etag = f.read().strip() or None
+        except FileNotFoundError:
+            etag = None
+    
     # Fetch from GitHub API if needed
-    if contributors_data is None:
-        print("Fetching contributor data from GitHub API...", file=sys.stderr)
+    if contributors_data is None or etag:
+        cached_data = contributors_data
+        contributors_data = None
+        if cached_data is None:
+            print("Fetching contributor data from GitHub API...", file=sys.stderr)
+        else:
+            print("Checking GitHub API for updated contributor data...", file=sys.stderr)
         max_retries = 3
         retry_delay = 2
         
         for attempt in range(max_retries):
             try:
                 url = "https://api.github.com/repos/block/goose/stats/contributors"
-                with urllib.request.urlopen(url, timeout=30) as response:
-                    contributors_data = json.loads(response.read().decode('utf-8'))
+                headers = dict(GITHUB_API_HEADERS)
+                if etag:
+                    headers['If-None-Match'] = etag
+                request = urllib.request.Request(url, headers=headers)
+                with urllib.request.urlopen(request, timeout=30) as response:
+                    contributors_data = load_json_bytes(response.read())
+                    response_etag = response.headers.get('ETag')
                 
                 # Validate the response
                 if contributors_data and isinstance(contributors_data, list) and len(contributors_data) > 0:
                     # Save to file for future use
                     with open(github_data_file, 'w') as f:
                         json.dump(contributors_data, f)
+                    if response_etag:
+                        with open(github_etag_file, 'w') as f:
+                            f.write(response_etag)
                     print(f"✓ Successfully fetched data for {len(contributors_data)} contributors", file=sys.stderr)
                     break
                 else:
                     print(f"Attempt {attempt + 1}/{max_retries}: GitHub API returned empty data. Retrying...", file=sys.stderr)
                     contributors_data = None
                     if attempt < max_retries - 1:
-                        time.sleep(retry_delay)
+                        time.sleep(retry_wait_seconds(None, retry_delay))
+                        retry_delay *= 2
             except Exception as e:
+                if isinstance(e, urllib.error.HTTPError) and e.code == 304:
+                    contributors_data = cached_data
+                    print("✓ Cached contributor data is up to date", file=sys.stderr)
+                    break
                 print(f"Attempt {attempt + 1}/{max_retries}: Error fetching from GitHub API: {e}", file=sys.stderr)
                 if attempt < max_retries - 1:
-                    time.sleep(retry_delay)
-                else:
+                    time.sleep(retry_wait_seconds(e, retry_delay))
+                    retry_delay *= 2
+                elif cached_data is None:
                     print("\nError: Could not fetch GitHub contributor data after multiple attempts.")
                     print("The GitHub stats API may be temporarily unavailable or still computing statistics.")
                     print("Please try again in a few minutes.")
                     sys.exit(1)
         
+        if contributors_data is None and cached_data is not None:
+            print("Warning: Could not refresh contributor data, using cached copy", file=sys.stderr)
+            contributors_data = cached_data
+        
         if contributors_data is None:
             print("\nError: GitHub API returned empty data after multiple attempts.")
             print("The repository statistics may still be computing. Please try again in a few minutes.")
@@ -248,115 +518,162 @@ def main():
 
     # Process contributors
     contributor_stats = []
-    checked_orgs = {}  # Cache org checks to avoid redundant API calls
-    
-    print("Checking contributor organizations...", file=sys.stderr)
+    # Cache org checks to avoid redundant API calls, seeded from previous runs
+    block_employee_cache = load_block_employee_cache()
+    checked_orgs = {username: entry['is_block'] for username, entry in block_employee_cache.items()}
+    # Users whose org membership still has to be looked up, by lowercase name
+    unchecked_users = {}
+
+    # Lowercase every login once up front (None for deleted users)
+    authors_lower = [c['author']['login'].lower() if c.get('author') else None
+                     for c in contributors_data]
 
-    for contributor in contributors_data:
+    for contributor, username_lower in zip(contributors_data, authors_lower):
         # Skip if author is None (deleted users)
-        if contributor.get('author') is None:
+        if username_lower is None:
             continue
             
         username = contributor['author']['login']
-        username_lower = username.lower()
         
         # Skip excluded categories (case-insensitive matching)
-        if username_lower in bots or username_lower in goose_maintainers or username_lower in external_goose:
+        listed_category = category_of.get(username_lower)
+        if listed_category in EXCLUDED_CATEGORIES:
+            continue
+        
+        # Skip contributors with no commits at all, or none overlapping the period
+        weeks = contributor['weeks']
+        if (contributor.get('total') == 0 or not weeks
+                or weeks[-1]['w'] < start_timestamp or weeks[0]['w'] > end_timestamp):
             continue
         
         # Calculate stats for the specified period
-        period_commits = 0
-        period_additions = 0
-        period_deletions = 0
+        # Weeks are sorted by timestamp, so binary search for the period's slice
+        # (bisect's key= needs Python 3.10+)
+        period_weeks = weeks[bisect.bisect_left(weeks, start_timestamp, key=WEEK_TIMESTAMP):
+                             bisect.bisect_right(weeks, end_timestamp, key=WEEK_TIMESTAMP)]
         
-        for week in contributor['weeks']:
-            week_timestamp = week['w']
-            if start_timestamp <= week_timestamp <= end_timestamp:
-                period_commits += week['c']
-                period_additions += week['a']
-                period_deletions += week['d']
+        # sum(map(itemgetter)) runs the whole reduction in C
+        period_commits = sum(map(WEEK_COMMITS, period_weeks))
+        period_additions = sum(map(WEEK_ADDITIONS, period_weeks))
+        period_deletions = sum(map(WEEK_DELETIONS, period_weeks))
         
         # Only include contributors with activity in the period
         if period_commits > 0:
             total_lines = period_additions + period_deletions
             
-            # Categorize (only Block non-goose and External now)
-            if username_lower in block_non_goose:
-                category = 'block_non_goose'
+            # Categorize (only Block non-goose and External now); anyone not
+            # listed is resolved by the org check below
+            if listed_category == BLOCK_NON_GOOSE:
+                category = BLOCK_NON_GOOSE
             else:
-                # Check if user is in a Block org (with caching)
-                if username not in checked_orgs:
-                    checked_orgs[username] = is_block_employee(username)
-                    # Add a small delay to avoid rate limiting
-                    time.sleep(0.1)
-                
-                if checked_orgs[username]:
-                    category = 'block_non_goose'
-                    print(f"  ✓ Detected Block employee: @{username}", file=sys.stderr)
-                else:
-                    category = 'external'
+                category = None
+                if username_lower not in checked_orgs:
+                    unchecked_users.setdefault(username_lower, username)
             
-            contributor_stats.append({
-                'username': username,
-                'category': category,
-                'commits': period_commits,
-                'additions': period_additions,
-                'deletions': period_deletions,
-                'total_lines': total_lines,
-                'score': period_commits + total_lines
-            })
-
-    # Sort by score
-    contributor_stats.sort(key=lambda x: x['score'], reverse=True)
-
-    # Separate by category
-    block_list = [c for c in contributor_stats if c['category'] == 'block_non_goose']
-    external_list = [c for c in contributor_stats if c['category'] == 'external']
+            contributor_stats.append(ContributorStats(
+                username=username,
+                category=category,
+                commits=period_commits,
+                additions=period_additions,
+                deletions=period_deletions,
+                total_lines=total_lines,
+                score=period_commits + total_lines
+            ))
+
+    # Check if users are in a Block org: batched via GraphQL when authenticated,
+    # then per-user REST lookups (several at a time) for anything left over
+    print("Checking contributor organizations...", file=sys.stderr)
+    if GITHUB_TOKEN and unchecked_users:
+        graphql_results = check_block_employees_graphql(list(unchecked_users.values()))
+        for username_lower, username in list(unchecked_users.items()):
+            is_block = graphql_results.get(username)
+            if is_block is not None:
+                checked_orgs[username_lower] = is_block
+                block_employee_cache[username_lower] = {'is_block': is_block, 'ts': time.time()}
+                del unchecked_users[username_lower]
+    
+    with ThreadPoolExecutor(max_workers=ORG_CHECK_WORKERS) as executor:
+        results = executor.map(is_block_employee, unchecked_users.values())
+        for username_lower, is_block in zip(unchecked_users, results):
+            checked_orgs[username_lower] = is_block
+            if is_block is not None:
+                block_employee_cache[username_lower] = {'is_block': is_block, 'ts': time.time()}
+
+    save_block_employee_cache(block_employee_cache)
+
+    for contrib in contributor_stats:
+        if contrib.category is None:
+            if checked_orgs[contrib.username.lower()]:
+                contrib.category = BLOCK_NON_GOOSE
+                print(f"  ✓ Detected Block employee: @{contrib.username}", file=sys.stderr)
+            else:
+                contrib.category = EXTERNAL
+
+    # Sort by score; only the full leaderboard needs every contributor ordered
+    if not stars_only:
+        contributor_stats.sort(key=SCORE, reverse=True)
+
+    # Separate by category in a single pass (keeps score order when sorted)
+    block_list = []
+    external_list = []
+    category_lists = {BLOCK_NON_GOOSE: block_list, EXTERNAL: external_list}
+    for contrib in contributor_stats:
+        category_lists[contrib.category].append(contrib)
 
     # Get top 5 from each
-    top_external = external_list[:5]
-    top_internal = block_list[:5]
-
-    # Print results
-    print("=" * 70)
-    print(f"COMMUNITY STARS - {display_period.upper()}")
-    print(f"(Period: {start_date.strftime('%B %d, %Y')} - {end_date.strftime('%B %d, %Y')})")
-    print("=" * 70)
-    print()
-
-    print("🏆 TOP 5 COMMUNITY ALL-STARS (External Contributors)")
-    print("-" * 70)
+    if stars_only:
+        top_external = heapq.nlargest(5, external_list, key=SCORE)
+        top_internal = heapq.nlargest(5, block_list, key=SCORE)
+    else:
+        top_external = external_list[:5]
+        top_internal = block_list[:5]
+
+    # Build the report and write it in one go
+    lines = []
+    out = lines.append
+
+    out("=" * 70)
+    out(f"COMMUNITY STARS - {display_period.upper()}")
+    out(f"(Period: {start_date.strftime('%B %d, %Y')} - {end_date.strftime('%B %d, %Y')})")
+    out("=" * 70)
+    out("")
+
+    out("🏆 TOP 5 COMMUNITY ALL-STARS (External Contributors)")
+    out("-" * 70)
     if top_external:
         for i, contrib in enumerate(top_external, 1):
-            print(f"{i}. @{contrib['username']:20s} - {contrib['commits']:3d} commits, {contrib['total_lines']:6,d} lines")
+            out(f"{i}. @{contrib.username:20s} - {contrib.commits:3d} commits, {contrib.total_lines:6,d} lines")
     else:
-        print("No external contributors found for this period.")
+        out("No external contributors found for this period.")
 
-    print()
-    print("⭐ TOP 5 TEAM STARS (Block, non-goose)")
-    print("-" * 70)
+    out("")
+    out("⭐ TOP 5 TEAM STARS (Block, non-goose)")
+    out("-" * 70)
     if top_internal:
         for i, contrib in enumerate(top_internal, 1):
-            print(f"{i}. @{contrib['username']:20s} - {contrib['commits']:3d} commits, {contrib['total_lines']:6,d} lines")
-    else:
-        print("No internal contributors found for this period.")
-
-    print()
-    print("📊 MONTHLY LEADERBOARD (All Contributors)")
-    print("-" * 70)
-    if contributor_stats:
-        for i, contrib in enumerate(contributor_stats, 1):
-            cat_label = "External" if contrib['category'] == 'external' else "Block"
-            print(f"{i:2d}. @{contrib['username']:20s} - {contrib['commits']:3d} commits, {contrib['total_lines']:6,d} lines [{cat_label}]")
+            out(f"{i}. @{contrib.username:20s} - {contrib.commits:3d} commits, {contrib.total_lines:6,d} lines")
     else:
-        print("No contributors found for this period.")
-
-    print()
-    print("=" * 70)
-    print(f"Total contributors (excluding bots, goose maintainers, external goose): {len(contributor_stats)}")
-    print(f"  External: {len(external_list)}")
-    print(f"  Block (non-goose): {len(block_list)}")
-    print("=" * 70)
+        out("No internal contributors found for this period.")
+
+    if not stars_only:
+        out("")
+        out("📊 MONTHLY LEADERBOARD (All Contributors)")
+        out("-" * 70)
+        if contributor_stats:
+            for i, contrib in enumerate(contributor_stats, 1):
+                cat_label = "External" if contrib.category == EXTERNAL else "Block"
+                out(f"{i:2d}. @{contrib.username:20s} - {contrib.commits:3d} commits, {contrib.total_lines:6,d} lines [{cat_label}]")
+        else:
+            out("No contributors found for this period.")
+
+    out("")
+    out("=" * 70)
+    out(f"Total contributors (excluding bots, goose maintainers, external goose): {len(contributor_stats)}")
+    out(f"  External: {len(external_list)}")
+    out(f"  Block (non-goose): {len(block_list)}")
+    out("=" * 70)
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 if __name__ == "__main__":
     main()
@@ -1,6 +1,6 @@
 #!/usr/bin/env -S uv run --quiet --script
 # /// script
-# dependencies = ["textual>=0.87.0", "pyperclip"]
+# dependencies = ["textual>=0.87.0", "pyperclip", "orjson"]
 # ///
 """
 WARNING: entirely vibe coded. use as a throwaway tool
@@ -11,9 +11,17 @@ Diagnostics Viewer - Browse and inspect Goose diagnostics bundles.
 Scans for diagnostics zip files, displays their sessions, and provides
 an interactive viewer for examining session data, logs, and other files.
 """
+import functools
 import json
+import mmap
+import os
+import struct
 import sys
+import threading
 import zipfile
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, Any
 
@@ -25,15 +33,143 @@ from textual.containers import Horizontal, Vertical, VerticalScroll, Container
 from textual.binding import Binding
 from textual.message import Message
 from textual.screen import ModalScreen
+from textual.worker import get_current_worker
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is used otherwise
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either
+json_loads = orjson.loads if orjson else json.loads
+
+
+# Characters of decoded text each session keeps in memory for re-visits and
+# copies; files larger than this are read again each time instead
+READ_CACHE_CHARS = 32 << 20
+
+# Uncompressed bytes of JSONL files whose parsed lines each session keeps; the
+# parsed objects take several times this, so it is smaller than the text budget
+JSONL_CACHE_BYTES = 16 << 20
+
+# Bundles opened in parallel while scanning; the work is mostly file I/O and zlib
+SCAN_WORKERS = 8
+
+# JSONL members at least this large (uncompressed) are parsed in a worker thread
+BACKGROUND_PARSE_SIZE = 1 << 20
+
+# Clipboard payloads longer than this are middle-truncated before copying
+MAX_COPY_CHARS = 5_000_000
+
+# Files listed ahead of the alphabetical rest, by base name
+FILE_RANKS = {'system.txt': 0, 'session.json': 1, 'config.yaml': 2}
 
 
 def truncate_string(s: str, max_len: int = 100, edge_len: int = 35) -> str:
     """Truncate a string if it's longer than max_len."""
-    if len(s) <= max_len:
+    n = len(s)
+    if n <= max_len:
         return s
+    return f"{s[:edge_len]}[{n - 2 * edge_len} more]{s[-edge_len:]}"
+
 
-    omitted = len(s) - (2 * edge_len)
-    return f"{s[:edge_len]}[{omitted} more]{s[-edge_len:]}"
+def copy_to_clipboard(app: App, text: str):
+    """Copy text to the clipboard from a worker thread.
+
+    pyperclip pipes the text through pbcopy/xclip, which would block the UI
+    for large payloads. Text over MAX_COPY_CHARS is middle-truncated first.
+    """
+    message = "Copied to clipboard"
+    if len(text) > MAX_COPY_CHARS:
+        text = truncate_string(text, MAX_COPY_CHARS, MAX_COPY_CHARS // 2 - 100)
+        message = f"Copied to clipboard (truncated to {MAX_COPY_CHARS:,} characters)"
+
+    def copy():
+        pyperclip.copy(text)
+        app.call_from_thread(app.notify, message)
+
+    app.run_worker(copy, thread=True, group="clipboard")
+
+
+def format_value(value: Any) -> str:
+    """Format a scalar JSON value as tree markup."""
+    if isinstance(value, bool):
+        # Check bool before int/float since bool is a subclass of int
+        return f"[magenta]{str(value).lower()}[/magenta]"
+    elif isinstance(value, (int, float)):
+        return f"[yellow]{value}[/yellow]"
+    elif value is None:
+        return "[dim]null[/dim]"
+    else:
+        return str(value)
+
+
+# Exact-type fast path for format_value; anything else goes through its isinstance checks
+VALUE_FORMATTERS = {
+    bool: lambda value: "[magenta]true[/magenta]" if value else "[magenta]false[/magenta]",
+    int: lambda value: f"[yellow]{value}[/yellow]",
+    float: lambda value: f"[yellow]{value}[/yellow]",
+    type(None): lambda value: "[dim]null[/dim]",
+}
+
+
+# Tree label templates for children of a dict (cyan keys) and of a list (yellow
+# indices), so each label is built with a single % format
+LABEL_TEMPLATES = {
+    parent_type: {
+        dict: f"[{color}]%s[/{color}]: {{...}}",
+        list: f"[{color}]%s[/{color}]: [...]",
+        str: f"[{color}]%s[/{color}]: [green]\"%s\"[/green]",
+        "leaf": f"[{color}]%s[/{color}]: %s",
+    }
+    for parent_type, color in ((dict, "cyan"), (list, "yellow"))
+}
+
+
+def format_json(data: Any) -> str:
+    """Pretty-format JSON data with a two-space indent."""
+    if orjson:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(data, indent=2)
+
+
+def split_jsonl(content: str) -> list[str]:
+    """Split JSONL content into its non-empty, stripped lines."""
+    return [line for line in map(str.strip, content.split('\n')) if line]
+
+
+def parse_jsonl(content: bytes) -> tuple[Any, list[Any]]:
+    """Parse raw JSONL bytes into its request (first line) and responses.
+
+    Malformed lines are skipped; diagnostics may be truncated or corrupted.
+    """
+    loads = json_loads
+
+    def parse(line: bytes) -> Any:
+        try:
+            return loads(line)
+        except ValueError:
+            # Invalid UTF-8 is replaced rather than rejected, as for text reads
+            return loads(line.decode('utf-8', errors='replace'))
+
+    # One pass over the non-empty lines: the first is the request, the rest responses
+    lines = (line for line in map(bytes.strip, content.split(b'\n')) if line)
+    request_data = None
+    for line in lines:
+        try:
+            request_data = parse(line)
+        except ValueError:
+            pass
+        break
+
+    responses = []
+    for line in lines:
+        try:
+            responses.append(parse(line))
+        except ValueError:
+            pass
+
+    return request_data, responses
 
 
 class JsonTreeView(Tree):
@@ -48,21 +184,47 @@ class JsonTreeView(Tree):
         self.json_data = None
         self.show_root = False
         self.all_expanded = False
+        # Containers whose children are built on first expansion: node id -> (value, depth)
+        self._pending: dict[Any, tuple[Any, int]] = {}
 
     def load_json(self, data: Any, label: str = "JSON"):
-        """Load JSON data into the tree."""
+        """Load JSON data into the tree.
+
+        Only the first level is built up front; deeper containers are filled
+        in when they are expanded.
+        """
         self.json_data = data
-        self.clear()
-        self.root.label = label
-        self._build_tree(self.root, data)
-        # Expand all nodes by default
-        self.root.expand_all()
+        # Hold repaints until every node has been added
+        with self.app.batch_update():
+            self.clear()
+            self._pending.clear()
+            self.root.label = label
+            self._build_tree(self.root, data)
+            self.root.expand()
+
+    def _build_pending(self, node):
+        """Build every not-yet-built container below node."""
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            pending = self._pending.pop(node.id, None)
+            if pending is not None:
+                self._build_tree(node, *pending)
+            stack.extend(node.children)
+
+    def on_tree_node_expanded(self, event: Tree.NodeExpanded):
+        """Build a container's children the first time it is expanded."""
+        pending = self._pending.pop(event.node.id, None)
+        if pending is not None:
+            self._build_tree(event.node, *pending)
 
     def action_toggle_all(self):
         """Toggle expansion of all nodes."""
         self.all_expanded = not self.all_expanded
         if self.all_expanded:
-            self.root.expand_all()
+            with self.app.batch_update():
+                self._build_pending(self.root)
+                self.root.expand_all()
         else:
             self.root.collapse_all()
             self.root.expand()  # Keep root expanded
@@ -83,63 +245,52 @@ class JsonTreeView(Tree):
             # Prevent default tree expansion behavior
             event.stop()
 
-    def _build_tree(self, node, data, max_depth=10, current_depth=0):
-        """Recursively build the tree from JSON data."""
-        if current_depth > max_depth:
-            node.add_leaf("[dim]...[/dim]")
-            return
+    def _build_tree(self, node, data, current_depth=0, max_depth=10):
+        """Build the tree from JSON data.
 
-        if isinstance(data, dict):
-            for key, value in data.items():
-                if isinstance(value, (dict, list)) and value:
-                    # Expand first level by default
-                    child = node.add(f"[cyan]{key}[/cyan]: {{...}}" if isinstance(value, dict) else f"[cyan]{key}[/cyan]: [...]", expand=(current_depth == 0))
-                    child.data = {"key": key, "value": value, "type": type(value).__name__, "expandable": False}
-                    self._build_tree(child, value, max_depth, current_depth + 1)
-                elif isinstance(value, str):
+        Builds one level below node, plus the first level of the whole tree
+        which is expanded by default; deeper containers are left pending.
+        """
+        stack = [(node, data, current_depth)]
+        while stack:
+            node, data, current_depth = stack.pop()
+            if current_depth > max_depth:
+                node.add_leaf("[dim]...[/dim]")
+                continue
+
+            if isinstance(data, dict):
+                items = data.items()
+                templates = LABEL_TEMPLATES[dict]
+            elif isinstance(data, list):
+                items = enumerate(data)
+                templates = LABEL_TEMPLATES[list]
+            else:
+                continue
+            str_template = templates[str]
+            leaf_template = templates["leaf"]
+
+            for key, value in items:
+                value_type = type(value)
+                if (value_type is dict or value_type is list) and value:
+                    label = templates[value_type] % key
+                    if current_depth == 0:
+                        # Expand first level by default
+                        child = node.add(label, expand=True)
+                        stack.append((child, value, current_depth + 1))
+                    else:
+                        child = node.add(label, expand=False)
+                        self._pending[child.id] = (value, current_depth + 1)
+                elif value_type is str:
                     truncated = truncate_string(value)
                     if truncated != value:
                         # Make truncated strings expandable
-                        child = node.add(f"[cyan]{key}[/cyan]: [green]\"{truncated}\"[/green]", expand=False)
+                        child = node.add(str_template % (key, truncated), expand=False)
                         child.data = {"key": key, "value": value, "type": "str", "truncated": True, "expandable": True}
                         child.allow_expand = False  # Don't show expand icon initially
                     else:
-                        node.add_leaf(f"[cyan]{key}[/cyan]: [green]\"{value}\"[/green]")
-                elif isinstance(value, bool):
-                    # Check bool before int/float since bool is a subclass of int
-                    node.add_leaf(f"[cyan]{key}[/cyan]: [magenta]{str(value).lower()}[/magenta]")
-                elif isinstance(value, (int, float)):
-                    node.add_leaf(f"[cyan]{key}[/cyan]: [yellow]{value}[/yellow]")
-                elif value is None:
-                    node.add_leaf(f"[cyan]{key}[/cyan]: [dim]null[/dim]")
-                else:
-                    node.add_leaf(f"[cyan]{key}[/cyan]: {value}")
-
-        elif isinstance(data, list):
-            for i, item in enumerate(data):
-                if isinstance(item, (dict, list)) and item:
-                    # Expand first level by default
-                    child = node.add(f"[yellow]{i}[/yellow]: {{...}}" if isinstance(item, dict) else f"[yellow]{i}[/yellow]: [...]", expand=(current_depth == 0))
-                    child.data = {"key": i, "value": item, "type": type(item).__name__, "expandable": False}
-                    self._build_tree(child, item, max_depth, current_depth + 1)
-                elif isinstance(item, str):
-                    truncated = truncate_string(item)
-                    if truncated != item:
-                        # Make truncated strings expandable
-                        child = node.add(f"[yellow]{i}[/yellow]: [green]\"{truncated}\"[/green]", expand=False)
-                        child.data = {"key": i, "value": item, "type": "str", "truncated": True, "expandable": True}
-                        child.allow_expand = False  # Don't show expand icon initially
-                    else:
-                        node.add_leaf(f"[yellow]{i}[/yellow]: [green]\"{item}\"[/green]")
-                elif isinstance(item, bool):
-                    # Check bool before int/float since bool is a subclass of int
-                    node.add_leaf(f"[yellow]{i}[/yellow]: [magenta]{str(item).lower()}[/magenta]")
-                elif isinstance(item, (int, float)):
-                    node.add_leaf(f"[yellow]{i}[/yellow]: [yellow]{item}[/yellow]")
-                elif item is None:
-                    node.add_leaf(f"[yellow]{i}[/yellow]: [dim]null[/dim]")
+                        node.add_leaf(str_template % (key, value))
                 else:
-                    node.add_leaf(f"[yellow]{i}[/yellow]: {item}")
+                    node.add_leaf(leaf_template % (key, VALUE_FORMATTERS.get(value_type, format_value)(value)))
 
 
 class TextViewerModal(ModalScreen):
@@ -169,8 +320,7 @@ class TextViewerModal(ModalScreen):
 
     def action_copy(self):
         """Copy the text to clipboard."""
-        pyperclip.copy(self.text)
-        self.notify("Copied to clipboard")
+        copy_to_clipboard(self.app, self.text)
 
 
 class SearchOverlay(Container):
@@ -190,63 +340,212 @@ class SearchOverlay(Container):
 class DiagnosticsSession:
     """Represents a diagnostics bundle."""
 
-    def __init__(self, zip_path: Path):
+    def __init__(self, zip_path: Path, created_at: Optional[float] = None):
         self.zip_path = zip_path
         self.name = "Unknown Session"
         self.session_id = zip_path.stem
-        self.created_at = zip_path.stat().st_mtime
+        self.created_at = zip_path.stat().st_mtime if created_at is None else created_at
+        self._zf: Optional[zipfile.ZipFile] = None
+        self._mmap: Optional[mmap.mmap] = None
+        self._file_list: Optional[list[str]] = None
+        self._read_cache: OrderedDict[str, str] = OrderedDict()
+        self._read_cache_chars = 0
+        self._json_cache: dict[str, Any] = {}
+        self._jsonl_cache: OrderedDict[str, tuple[Any, list[Any]]] = OrderedDict()
+        self._jsonl_sizes: dict[str, int] = {}
+        self._jsonl_cache_bytes = 0
+        # Guards the zip handle and mmap, which JSONL parse workers also read
+        # through; the caches are only touched on the UI thread
+        self.lock = threading.RLock()
         self._load_session_name()
 
+    def _open(self) -> zipfile.ZipFile:
+        """Return the open zip file, opening it on first use."""
+        with self.lock:
+            if self._zf is None:
+                self._zf = zipfile.ZipFile(self.zip_path, 'r')
+            return self._zf
+
+    def close(self):
+        """Close the zip file if it is open."""
+        with self.lock:
+            if self._mmap is not None:
+                self._mmap.close()
+                self._mmap = None
+            if self._zf is not None:
+                self._zf.close()
+                self._zf = None
+
     def _load_session_name(self):
         """Extract session name from session.json."""
         try:
-            with zipfile.ZipFile(self.zip_path, 'r') as zf:
-                # Find session.json
-                for name in zf.namelist():
-                    if name.endswith('session.json'):
-                        with zf.open(name) as f:
-                            data = json.load(f)
-                            self.name = data.get('name', 'Unknown Session')
-                            self.session_id = data.get('id', self.zip_path.stem)
-                        break
+            zf = self._open()
+            # Find session.json, trying the usual locations before scanning every name
+            name = next((candidate for candidate in ('session.json', f'{self.zip_path.stem}/session.json')
+                         if candidate in zf.NameToInfo), None)
+            if name is None:
+                name = next((n for n in zf.namelist() if n.endswith('session.json')), None)
+            if name is not None:
+                with zf.open(name) as f:
+                    data = json_loads(f.read())
+                    self.name = data.get('name', 'Unknown Session')
+                    self.session_id = data.get('id', self.zip_path.stem)
         except Exception as e:
             self.name = f"Error loading: {e}"
+        finally:
+            # Every bundle is loaded at scan time; don't hold a descriptor for
+            # each one until it is opened (the zip is reopened on first read)
+            self.close()
 
     def get_file_list(self) -> list[str]:
         """Get list of files in the zip, sorted with system.txt first."""
-        try:
-            with zipfile.ZipFile(self.zip_path, 'r') as zf:
-                files = zf.namelist()
-
-                # Sort: system.txt first, then session.json, then alphabetically
-                def sort_key(f):
-                    if f.endswith('system.txt'):
-                        return (0, f)
-                    elif f.endswith('session.json'):
-                        return (1, f)
-                    elif f.endswith('config.yaml'):
-                        return (2, f)
-                    else:
-                        return (3, f)
+        if self._file_list is not None:
+            return self._file_list
 
-                return sorted(files, key=sort_key)
+        try:
+            files = self._open().namelist()
         except Exception:
             return []
 
+        # Sort: system.txt first, then session.json, then config.yaml, then alphabetically
+        def sort_key(f):
+            return (FILE_RANKS.get(f.rpartition('/')[2], 3), f)
+
+        self._file_list = sorted(files, key=sort_key)
+        return self._file_list
+
     def read_file(self, filename: str) -> Optional[str]:
         """Read a file from the zip.
 
         Returns:
             File content as string, or None if file cannot be read.
         """
+        content = self._read_cache.get(filename)
+        if content is not None:
+            self._read_cache.move_to_end(filename)
+            return content
+
+        raw = self.read_file_bytes(filename)
+        if raw is None:
+            return None
+        content = raw.decode('utf-8', errors='replace')
+
+        if len(content) > READ_CACHE_CHARS:
+            return content
+        self._read_cache[filename] = content
+        self._read_cache_chars += len(content)
+        while self._read_cache_chars > READ_CACHE_CHARS:
+            evicted, evicted_content = self._read_cache.popitem(last=False)
+            self._read_cache_chars -= len(evicted_content)
+            self._json_cache.pop(evicted, None)
+        return content
+
+    def read_file_bytes(self, filename: str) -> Optional[bytes]:
+        """Read a file's raw bytes from the zip, without caching.
+
+        Returns:
+            File content as bytes, or None if file cannot be read.
+        """
+        # Held for the whole read so close() can't pull the zip or mmap away
+        # from a worker mid-read
+        with self.lock:
+            try:
+                zf = self._open()
+                info = zf.getinfo(filename)
+                # Stored (uncompressed, unencrypted) members can skip the decompressor
+                if info.compress_type == zipfile.ZIP_STORED and not info.flag_bits & 0x1:
+                    data = self._read_stored(info)
+                    if data is not None:
+                        return data
+                with zf.open(info) as f:
+                    return f.read()
+            except Exception:
+                # File not found or cannot be read
+                return None
+
+    def _read_stored(self, info: zipfile.ZipInfo) -> Optional[bytes]:
+        """Slice a stored member straight out of the memory-mapped zip.
+
+        Returns None if the member can't be located or fails its CRC check,
+        so the caller can fall back to ZipFile.open.
+        """
+        try:
+            if self._mmap is None:
+                self._mmap = mmap.mmap(self._zf.fp.fileno(), 0, access=mmap.ACCESS_READ)
+            mm = self._mmap
+
+            # The local header's name/extra lengths can differ from the central directory's
+            offset = info.header_offset
+            header = mm[offset:offset + zipfile.sizeFileHeader]
+            if len(header) != zipfile.sizeFileHeader or header[:4] != zipfile.stringFileHeader:
+                return None
+            name_len, extra_len = struct.unpack('<2H', header[26:30])
+            start = offset + zipfile.sizeFileHeader + name_len + extra_len
+
+            data = mm[start:start + info.file_size]
+            if len(data) != info.file_size or zlib.crc32(data) != info.CRC:
+                return None
+            return data
+        except (OSError, ValueError):
+            return None
+
+    def get_json(self, filename: str) -> Any:
+        """Parse a JSON file from the zip, reusing earlier parses.
+
+        Raises:
+            json.JSONDecodeError: If the file is not valid JSON.
+        """
+        if filename in self._json_cache:
+            return self._json_cache[filename]
+
+        data = json_loads(self.read_file(filename))
+        if filename in self._read_cache:
+            self._json_cache[filename] = data
+        return data
+
+    def file_size(self, filename: str) -> int:
+        """Uncompressed size of a file in the zip, or 0 if it cannot be found."""
         try:
-            with zipfile.ZipFile(self.zip_path, 'r') as zf:
-                with zf.open(filename) as f:
-                    return f.read().decode('utf-8', errors='replace')
+            return self._open().getinfo(filename).file_size
         except Exception:
-            # File not found or cannot be read
+            return 0
+
+    def has_parsed_jsonl(self, filename: str) -> bool:
+        """Whether get_jsonl would return a cached parse for filename."""
+        return filename in self._jsonl_cache
+
+    def get_jsonl(self, filename: str) -> Optional[tuple[Any, list[Any]]]:
+        """Parse a JSONL file into its request (first line) and responses.
+
+        Returns:
+            (request_data, responses), or None if the file cannot be read.
+        """
+        if filename in self._jsonl_cache:
+            self._jsonl_cache.move_to_end(filename)
+            return self._jsonl_cache[filename]
+
+        # Parse straight from the raw bytes; the decoded text of a large log is
+        # only needed if it is copied
+        content = self.read_file_bytes(filename)
+        if content is None:
             return None
 
+        result = parse_jsonl(content)
+        self.cache_jsonl(filename, result)
+        return result
+
+    def cache_jsonl(self, filename: str, result: tuple[Any, list[Any]]):
+        """Remember a parsed JSONL file, e.g. one parsed by a worker thread."""
+        size = self.file_size(filename)
+        if size > JSONL_CACHE_BYTES or filename in self._jsonl_cache:
+            return
+        self._jsonl_cache[filename] = result
+        self._jsonl_sizes[filename] = size
+        self._jsonl_cache_bytes += size
+        while self._jsonl_cache_bytes > JSONL_CACHE_BYTES:
+            evicted, _ = self._jsonl_cache.popitem(last=False)
+            self._jsonl_cache_bytes -= self._jsonl_sizes.pop(evicted)
+
 
 class FileContentPane(Vertical):
     """A pane that shows either JSON tree or plain text."""
@@ -310,43 +609,67 @@ class FileViewer(Vertical):
         self.current_filename = filename
         self.current_part = part
 
+        # Check if this is a JSONL file; those are parsed without decoding the whole file
+        if filename.endswith('.jsonl') and part:
+            if session.has_parsed_jsonl(filename) or session.file_size(filename) < BACKGROUND_PARSE_SIZE:
+                self._display_jsonl(session, filename, part, session.get_jsonl(filename))
+            else:
+                # Parse large logs off the UI thread so the app stays responsive
+                self._show_plain(filename, f"[dim]Parsing {filename}...[/dim]")
+                self.run_worker(functools.partial(self._parse_jsonl, session, filename, part),
+                                thread=True, exclusive=True, group="jsonl")
+            return
+
         content = session.read_file(filename)
         if content is None:
             self._show_plain(filename, f"[red]Error: Could not read file '{filename}'[/red]")
             return
 
-        # Check if this is a JSONL file
-        if filename.endswith('.jsonl') and part:
-            self._show_jsonl(filename, content, part)
-        elif filename.endswith('.json'):
-            self._show_json(filename, content)
+        if filename.endswith('.json'):
+            self._show_json(filename)
         else:
             self._show_plain(filename, content)
 
         # Auto-focus the content
         self.post_message(self.ContentReady())
 
-    def _show_jsonl(self, filename: str, content: str, part: str):
-        """Show JSONL file - either request or responses part."""
-        lines = [line.strip() for line in content.strip().split('\n') if line.strip()]
+    def _parse_jsonl(self, session: DiagnosticsSession, filename: str, part: str):
+        """Parse a JSONL file in a worker thread, then display it on the UI thread."""
+        worker = get_current_worker()
+        # action_back cancels this worker before closing the session, so checking
+        # under the session lock means a closed zip is never reopened from here
+        with session.lock:
+            if worker.is_cancelled:
+                return
+            content = session.read_file_bytes(filename)
+
+        # Parsing needs no session state, so it runs outside the lock
+        result = None if content is None else parse_jsonl(content)
+        if not worker.is_cancelled:
+            self.app.call_from_thread(self._display_jsonl, session, filename, part, result, True)
+
+    def _display_jsonl(self, session: DiagnosticsSession, filename: str, part: str,
+                       result: Optional[tuple[Any, list[Any]]], from_worker: bool = False):
+        """Show a parsed JSONL file part, unless the user has since moved on."""
+        if not self.is_mounted:
+            return
+        if (session, filename, part) != (self.current_session, self.current_filename, self.current_part):
+            return
 
-        # Parse lines
-        request_data = None
-        responses = []
+        if result is None:
+            self._show_plain(filename, f"[red]Error: Could not read file '{filename}'[/red]")
+            return
+        if from_worker:
+            # The session caches are only updated on the UI thread
+            session.cache_jsonl(filename, result)
+        self._show_jsonl(filename, part, result)
 
-        if len(lines) > 0:
-            try:
-                request_data = json.loads(lines[0])
-            except json.JSONDecodeError:
-                # Skip malformed request line; diagnostics may be truncated or corrupted
-                pass
+        # Auto-focus the content
+        self.post_message(self.ContentReady())
 
-        for i in range(1, len(lines)):
-            try:
-                responses.append(json.loads(lines[i]))
-            except json.JSONDecodeError:
-                # Skip individual malformed response lines; show only valid JSON entries
-                pass
+    def _show_jsonl(self, filename: str, part: str, result: tuple[Any, list[Any]]):
+        """Show JSONL file - either request or responses part."""
+        request_data, responses = result
 
         # Show content
         content_area = self.query_one("#content-area", Vertical)
@@ -366,7 +689,7 @@ class FileViewer(Vertical):
         else:
             content_area.mount(Static("[red]No data available for this part[/red]"))
 
-    def _show_json(self, filename: str, content: str):
+    def _show_json(self, filename: str):
         """Show JSON file with collapsible tree."""
         # Show content
         content_area = self.query_one("#content-area", Vertical)
@@ -374,7 +697,7 @@ class FileViewer(Vertical):
 
         tree = JsonTreeView(filename)
         try:
-            data = json.loads(content)
+            data = self.current_session.get_json(filename)
             tree.load_json(data, filename)
         except json.JSONDecodeError as e:
             tree.root.add_leaf(f"[red]Error parsing JSON: {e}[/red]")
@@ -444,33 +767,34 @@ class SessionViewer(Vertical):
                 # Build file tree
                 files = self.session.get_file_list()
 
-                # Group by directory
+                # Group by directory, holding repaints until every file has been added
                 dirs = {}
-                for file in files:
-                    parts = file.split('/')
-                    is_jsonl = file.endswith('.jsonl')
-
-                    if len(parts) == 1:
-                        # Root file
-                        if is_jsonl:
-                            # Add two entries for JSONL files
-                            tree.root.add_leaf(f"{file} - request", data={"file": file, "part": "request"})
-                            tree.root.add_leaf(f"{file} - responses", data={"file": file, "part": "responses"})
+                with self.app.batch_update():
+                    for file in files:
+                        parts = file.split('/')
+                        is_jsonl = file.endswith('.jsonl')
+
+                        if len(parts) == 1:
+                            # Root file
+                            if is_jsonl:
+                                # Add two entries for JSONL files
+                                tree.root.add_leaf(f"{file} - request", data={"file": file, "part": "request"})
+                                tree.root.add_leaf(f"{file} - responses", data={"file": file, "part": "responses"})
+                            else:
+                                tree.root.add_leaf(file, data={"file": file, "part": None})
                         else:
-                            tree.root.add_leaf(file, data={"file": file, "part": None})
-                    else:
-                        # File in directory
-                        dir_name = parts[0]
-                        if dir_name not in dirs:
-                            dirs[dir_name] = tree.root.add(dir_name, expand=True)
-
-                        file_name = '/'.join(parts[1:])
-                        if is_jsonl:
-                            # Add two entries for JSONL files
-                            dirs[dir_name].add_leaf(f"{file_name} - request", data={"file": file, "part": "request"})
-                            dirs[dir_name].add_leaf(f"{file_name} - responses", data={"file": file, "part": "responses"})
-                        else:
-                            dirs[dir_name].add_leaf(file_name, data={"file": file, "part": None})
+                            # File in directory
+                            dir_name = parts[0]
+                            if dir_name not in dirs:
+                                dirs[dir_name] = tree.root.add(dir_name, expand=True)
+
+                            file_name = '/'.join(parts[1:])
+                            if is_jsonl:
+                                # Add two entries for JSONL files
+                                dirs[dir_name].add_leaf(f"{file_name} - request", data={"file": file, "part": "request"})
+                                dirs[dir_name].add_leaf(f"{file_name} - responses", data={"file": file, "part": "responses"})
+                            else:
+                                dirs[dir_name].add_leaf(file_name, data={"file": file, "part": None})
 
                 yield tree
 
@@ -532,32 +856,30 @@ class SessionViewer(Vertical):
 
         # For JSONL files with a part, extract just that part and pretty-format
         if viewer.current_filename.endswith('.jsonl') and viewer.current_part:
-            lines = [line.strip() for line in content.strip().split('\n') if line.strip()]
+            # Reuse the viewer's parse; fall back to the raw lines if any were malformed
+            lines = split_jsonl(content)
+            request_data, responses = viewer.current_session.get_jsonl(viewer.current_filename)
             if viewer.current_part == "request" and lines:
-                try:
-                    data = json.loads(lines[0])
-                    content = json.dumps(data, indent=2)
-                except json.JSONDecodeError:
+                if request_data is not None:
+                    content = format_json(request_data)
+                else:
                     content = lines[0]
             elif viewer.current_part == "responses" and len(lines) > 1:
-                try:
-                    responses = [json.loads(line) for line in lines[1:]]
-                    if len(responses) == 1:
-                        content = json.dumps(responses[0], indent=2)
-                    else:
-                        content = json.dumps(responses, indent=2)
-                except json.JSONDecodeError:
+                if len(responses) != len(lines) - 1:
                     content = '\n'.join(lines[1:])
+                elif len(responses) == 1:
+                    content = format_json(responses[0])
+                else:
+                    content = format_json(responses)
         # Pretty-format regular JSON files too
         elif viewer.current_filename.endswith('.json'):
             try:
-                data = json.loads(content)
-                content = json.dumps(data, indent=2)
+                data = viewer.current_session.get_json(viewer.current_filename)
+                content = format_json(data)
             except json.JSONDecodeError:
                 pass
 
-        pyperclip.copy(content)
-        self.app.notify("Copied to clipboard")
+        copy_to_clipboard(self.app, content)
 
     def on_key(self, event):
         """Handle left/right navigation between panels."""
@@ -755,10 +1077,20 @@ class DiagnosticsApp(App):
         """Scan for diagnostics zip files."""
         self.sessions = []
 
-        # Find all diagnostics zip files
-        for zip_path in self.diagnostics_dir.glob("diagnostics*.zip"):
-            session = DiagnosticsSession(zip_path)
-            self.sessions.append(session)
+        # Find all diagnostics zip files; scandir entries carry their stat
+        # results so each bundle isn't stat'ed again
+        paths = []
+        mtimes = []
+        with os.scandir(self.diagnostics_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith('diagnostics') and entry.name.endswith('.zip') and entry.is_file():
+                    paths.append(Path(entry.path))
+                    mtimes.append(entry.stat().st_mtime)
+
+        # Load them several at a time
+        if paths:
+            with ThreadPoolExecutor(max_workers=min(SCAN_WORKERS, len(paths))) as executor:
+                self.sessions = list(executor.map(DiagnosticsSession, paths, mtimes))
 
         # Sort by creation time (newest first)
         self.sessions.sort(key=lambda s: s.created_at, reverse=True)
@@ -790,10 +1122,16 @@ class DiagnosticsApp(App):
     def action_back(self):
         """Go back to session list."""
         if isinstance(self.current_view, SessionViewer):
+            # Stop any JSONL parse still reading from the session before closing it
+            for viewer in self.current_view.query(FileViewer):
+                self.workers.cancel_group(viewer, "jsonl")
+            self.current_view.session.close()
             self.show_session_list()
 
     def action_quit(self):
         """Quit the application."""
+        for session in self.sessions:
+            session.close()
         self.exit()
 
     def action_search(self):
@@ -25,17 +25,30 @@ To use with Goose, set the provider host environment variables:
 """
 
 import asyncio
+import json
 import logging
 import os
 import random
+import re
+import sys
 import threading
 from argparse import ArgumentParser
 from enum import Enum
 from typing import Optional
 
-from aiohttp import web, ClientSession, ClientTimeout
+from aiohttp import web, ClientSession, ClientTimeout, TCPConnector
 from aiohttp.web import Request, Response, StreamResponse
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is used otherwise
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:  # optional faster event loop; stdlib asyncio is used otherwise
+    uvloop = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -61,6 +74,47 @@ ALWAYS_FORWARD_PATHS = [
     '/oauth',  # OAuth endpoints
     '/api/2.0/',  # Databricks management API
 ]
+ALWAYS_FORWARD_RE = re.compile('|'.join(map(re.escape, ALWAYS_FORWARD_PATHS)))
+
+# Paths that identify Databricks regardless of the request headers. The
+# provider regexes match case-insensitively so request paths need no lower()
+DATABRICKS_PATH_RE = re.compile(r'/serving-endpoints/|/api/2\.0/|/oidc/', re.IGNORECASE)
+
+# Path hints for bearer-token requests, in priority order
+PROVIDER_PATH_HINTS = [
+    ('anthropic', ('anthropic', 'messages')),
+    ('google', ('google', 'generativelanguage')),
+    ('openrouter', ('openrouter',)),
+    ('tetrate', ('tetrate',)),
+    ('databricks', ('databricks',)),
+]
+# Each alternative is a lookahead followed by an empty named group, so match()
+# picks the first provider in the list whose marker appears anywhere in the path
+# (not the leftmost marker) and lastgroup names it
+PROVIDER_PATH_RE = re.compile('|'.join(
+    f"(?=.*?(?:{'|'.join(map(re.escape, markers))}))(?P<{provider}>)"
+    for provider, markers in PROVIDER_PATH_HINTS
+), re.DOTALL | re.IGNORECASE)
+
+# Hop-by-hop headers that are not copied onto forwarded requests / responses
+HOP_BY_HOP_REQUEST_HEADERS = frozenset({
+    'host', 'connection', 'keep-alive', 'proxy-authenticate', 'proxy-authorization',
+    'te', 'trailers', 'transfer-encoding', 'upgrade',
+})
+HOP_BY_HOP_RESPONSE_HEADERS = frozenset({'connection', 'keep-alive', 'transfer-encoding'})
+
+# Real provider hosts from the environment (e.g. OPENAI_REAL_HOST), read once at startup
+PROVIDER_REAL_HOSTS = {
+    provider: os.environ.get(f"{provider.upper()}_REAL_HOST")
+    for provider in PROVIDER_HOSTS
+}
+
+
+def encode_json(data) -> bytes:
+    """Encode data as a JSON response body."""
+    if orjson:
+        return orjson.dumps(data)
+    return json.dumps(data).encode('utf-8')
 
 
 class ErrorMode(Enum):
@@ -71,6 +125,36 @@ class ErrorMode(Enum):
     SERVER_ERROR = 4
 
 
+# Status display strings for each error mode
+MODE_SYMBOLS = {
+    ErrorMode.NO_ERROR: "✅",
+    ErrorMode.CONTEXT_LENGTH: "📏",
+    ErrorMode.RATE_LIMIT: "⏱️",
+    ErrorMode.SERVER_ERROR: "💥"
+}
+MODE_TITLES = {
+    mode: f"{MODE_SYMBOLS[mode]} {mode.name.replace('_', ' ').title()}" for mode in ErrorMode
+}
+MODE_NAMES = {
+    ErrorMode.NO_ERROR: "✅ No error (pass through)",
+    ErrorMode.CONTEXT_LENGTH: "📏 Context length exceeded",
+    ErrorMode.RATE_LIMIT: "⏱️  Rate limit exceeded",
+    ErrorMode.SERVER_ERROR: "💥 Server error (500)"
+}
+COMMANDS_HELP = """
+Commands:
+  n      - No error (pass through) - permanent
+  c      - Context length exceeded (1 time)
+  c 4    - Context length exceeded (4 times)
+  c 0.3  - Context length exceeded (30% of requests)
+  c 30%  - Context length exceeded (30% of requests)
+  c *    - Context length exceeded (100% of requests)
+  r      - Rate limit error (1 time)
+  u      - Unknown server error (1 time)
+  q      - Quit
+"""
+
+
 # Error responses for each provider and error type
 ERROR_CONFIGS = {
     'openai': {
@@ -252,6 +336,11 @@ ERROR_CONFIGS = {
     }
 }
 
+# The error bodies never change, so encode each one once up front
+for provider_errors in ERROR_CONFIGS.values():
+    for error_config in provider_errors.values():
+        error_config['body_bytes'] = encode_json(error_config['body'])
+
 
 class ErrorProxy:
     """HTTP proxy that can inject errors into provider responses."""
@@ -263,21 +352,28 @@ class ErrorProxy:
         self.error_percentage = 0.0  # Percentage of requests to error (0.0 = count mode)
         self.request_count = 0
         self.session: Optional[ClientSession] = None
-        self.lock = threading.Lock()
+        # Error state is only modified on the event loop thread (or before the
+        # loop starts), so request handling reads and updates it without a lock
         
     def set_error_mode(self, mode: ErrorMode, count: int = 1, percentage: float = 0.0):
         """
         Set the error injection mode.
+
+        Must be called from the event loop thread; other threads should use
+        set_error_mode_async via asyncio.run_coroutine_threadsafe.
         
         Args:
             mode: The error mode to use
             count: Number of errors to inject (default 1, 0 for unlimited)
             percentage: Percentage of requests to error (0.0-1.0, 0.0 for count mode)
         """
-        with self.lock:
-            self.error_mode = mode
-            self.error_count = count
-            self.error_percentage = percentage
+        self.error_mode = mode
+        self.error_count = count
+        self.error_percentage = percentage
+
+    async def set_error_mode_async(self, mode: ErrorMode, count: int = 1, percentage: float = 0.0):
+        """Set the error injection mode from a coroutine scheduled on the event loop."""
+        self.set_error_mode(mode, count, percentage)
             
     def should_inject_error(self) -> bool:
         """
@@ -286,42 +382,57 @@ class ErrorProxy:
         Returns:
             True if an error should be injected, False otherwise
         """
-        with self.lock:
-            if self.error_mode == ErrorMode.NO_ERROR:
-                return False
-                
-            # Percentage mode
-            if self.error_percentage > 0.0:
-                return random.random() < self.error_percentage
+        # Pass-through is the steady state, so check it first
+        if self.error_mode is ErrorMode.NO_ERROR:
+            return False
             
-            # Count mode
-            if self.error_count > 0:
-                self.error_count -= 1
-                # If this was the last error, switch back to NO_ERROR
-                if self.error_count == 0:
-                    self.error_mode = ErrorMode.NO_ERROR
-                return True
-            elif self.error_count == 0 and self.error_percentage == 0.0:
-                # Count reached zero, switch back to NO_ERROR
+        # Percentage mode
+        if self.error_percentage > 0.0:
+            return random.random() < self.error_percentage
+        
+        # Count mode
+        if self.error_count > 0:
+            self.error_count -= 1
+            # If this was the last error, switch back to NO_ERROR
+            if self.error_count == 0:
                 self.error_mode = ErrorMode.NO_ERROR
-                return False
-
+            return True
+        elif self.error_count == 0 and self.error_percentage == 0.0:
+            # Count reached zero, switch back to NO_ERROR
+            self.error_mode = ErrorMode.NO_ERROR
             return False
+
+        return False
             
     def get_error_mode(self) -> ErrorMode:
         """Get the current error injection mode."""
-        with self.lock:
-            return self.error_mode
+        return self.error_mode
     
     def get_error_config(self) -> tuple[ErrorMode, int, float]:
         """Get the current error configuration."""
-        with self.lock:
-            return (self.error_mode, self.error_count, self.error_percentage)
+        return (self.error_mode, self.error_count, self.error_percentage)
         
     async def start_session(self):
         """Start the aiohttp client session."""
-        timeout = ClientTimeout(total=600)  # Match provider timeout
-        self.session = ClientSession(timeout=timeout)
+        # No cap on the whole request (long streams are fine), but give up on
+        # providers that stop connecting or go silent mid-response
+        timeout = ClientTimeout(total=None, connect=30, sock_connect=10, sock_read=300)
+        # Keep idle provider connections around so follow-up requests skip the
+        # TCP/TLS handshake, and don't cap the number of concurrent requests
+        connector = TCPConnector(
+            limit=0,
+            limit_per_host=256,
+            keepalive_timeout=120,
+            ttl_dns_cache=300,
+        )
+        # Pass bodies through still encoded; only ask for compression when the
+        # client did (its Accept-Encoding header is forwarded as-is)
+        self.session = ClientSession(
+            timeout=timeout,
+            connector=connector,
+            auto_decompress=False,
+            skip_auto_headers=('Accept-Encoding',),
+        )
         
     async def close_session(self):
         """Close the aiohttp client session."""
@@ -338,10 +449,10 @@ class ErrorProxy:
         Returns:
             Provider name
         """
-        path = request.path.lower()
+        path = request.path
 
         # Check for databricks-specific paths first (before header checks)
-        if '/serving-endpoints/' in path or '/api/2.0/' in path or '/oidc/' in path:
+        if DATABRICKS_PATH_RE.search(path):
             return 'databricks'
 
         # Check for provider-specific headers
@@ -353,16 +464,9 @@ class ErrorProxy:
             auth = request.headers['authorization'].lower()
             if 'bearer' in auth:
                 # Most providers use bearer tokens, check path for hints
-                if 'anthropic' in path or 'messages' in path:
-                    return 'anthropic'
-                if 'google' in path or 'generativelanguage' in path:
-                    return 'google'
-                if 'openrouter' in path:
-                    return 'openrouter'
-                if 'tetrate' in path:
-                    return 'tetrate'
-                if 'databricks' in path:
-                    return 'databricks'
+                match = PROVIDER_PATH_RE.match(path)
+                if match:
+                    return match.lastgroup
                 # Default to openai for bearer tokens
                 return 'openai'
 
@@ -379,11 +483,7 @@ class ErrorProxy:
         Returns:
             True if request should always be forwarded
         """
-        path = request.path
-        for forward_path in ALWAYS_FORWARD_PATHS:
-            if forward_path in path:
-                return True
-        return False
+        return ALWAYS_FORWARD_RE.search(request.path) is not None
 
     def get_target_url(self, request: Request, provider: str) -> str:
         """
@@ -397,17 +497,15 @@ class ErrorProxy:
             Full target URL
         """
         # Check for provider-specific real host in environment
-        real_host_env = f"{provider.upper()}_REAL_HOST"
-        base_host = os.environ.get(real_host_env)
+        base_host = PROVIDER_REAL_HOSTS.get(provider)
 
         # If no provider-specific real host and this is an always-forward path,
         # check if ANY *_REAL_HOST is set (for auth endpoints where provider detection might fail)
         if base_host is None and self.should_always_forward(request):
-            for provider_name in PROVIDER_HOSTS.keys():
-                env_var = f"{provider_name.upper()}_REAL_HOST"
-                if env_var in os.environ:
-                    base_host = os.environ[env_var]
-                    logger.info(f"Using {env_var} for always-forward path")
+            for provider_name, real_host in PROVIDER_REAL_HOSTS.items():
+                if real_host is not None:
+                    base_host = real_host
+                    logger.info("Using %s_REAL_HOST for always-forward path", provider_name.upper())
                     break
 
         # Fall back to default provider host
@@ -426,24 +524,16 @@ class ErrorProxy:
     def _format_status_line(self) -> str:
         """Format a one-line status indicator."""
         mode, count, percentage = self.get_error_config()
-        mode_symbols = {
-            ErrorMode.NO_ERROR: "✅",
-            ErrorMode.CONTEXT_LENGTH: "📏",
-            ErrorMode.RATE_LIMIT: "⏱️",
-            ErrorMode.SERVER_ERROR: "💥"
-        }
+        title = MODE_TITLES[mode]
 
-        symbol = mode_symbols.get(mode, "❓")
-        mode_name = mode.name.replace('_', ' ').title()
-
-        if mode == ErrorMode.NO_ERROR:
-            return f"{symbol} {mode_name}"
+        if mode is ErrorMode.NO_ERROR:
+            return title
         elif percentage > 0.0:
-            return f"{symbol} {mode_name} ({percentage*100:.0f}%)"
+            return f"{title} ({percentage*100:.0f}%)"
         elif count > 0:
-            return f"{symbol} {mode_name} ({count} remaining)"
+            return f"{title} ({count} remaining)"
         else:
-            return f"{symbol} {mode_name}"
+            return title
 
     async def handle_request(self, request: Request) -> Response:
         """
@@ -458,42 +548,49 @@ class ErrorProxy:
         self.request_count += 1
         provider = self.detect_provider(request)
 
-        logger.info(f"📨 Request #{self.request_count}: {request.method} {request.path} -> {provider}")
+        logger.info("📨 Request #%d: %s %s -> %s", self.request_count, request.method, request.path, provider)
 
         # Check if this request should always be forwarded
         if self.should_always_forward(request):
-            logger.info(f"🔄 Always forwarding: {request.path}")
+            logger.info("🔄 Always forwarding: %s", request.path)
         else:
             # Capture the error mode BEFORE checking if we should inject (since that modifies state)
-            mode_before_check = self.get_error_mode()
+            mode_before_check = self.error_mode
 
             # Check if we should inject an error
-            should_error = self.should_inject_error()
-            if should_error:
+            if self.should_inject_error():
                 # Use the mode captured before the check, since should_inject_error may have changed it
                 error_config = ERROR_CONFIGS.get(provider, ERROR_CONFIGS['openai']).get(
                     mode_before_check, ERROR_CONFIGS['openai'][ErrorMode.SERVER_ERROR]
                 )
-                logger.warning(f"💥 Injecting {mode_before_check.name} error (status {error_config['status']}) for {provider}")
+                logger.warning("💥 Injecting %s error (status %d) for %s",
+                               mode_before_check.name, error_config['status'], provider)
                 # Show status after the injection to reflect the updated state
-                logger.info(f"Status: {self._format_status_line()}")
-                return web.json_response(
-                    error_config['body'],
-                    status=error_config['status']
+                # (only build the status line when it will actually be logged)
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("Status: %s", self._format_status_line())
+                # Drain the unread request body so the client connection can be reused
+                await request.release()
+                return Response(
+                    body=error_config['body_bytes'],
+                    status=error_config['status'],
+                    content_type='application/json',
+                    charset='utf-8'
                 )
         
         # Forward the request to the actual provider
         target_url = self.get_target_url(request, provider)
         
         try:
-            # Read request body
-            body = await request.read()
+            # Stream the request body through instead of buffering it; the
+            # client's Content-Length (if any) is forwarded with the headers
+            body = request.content if request.body_exists else None
             
-            # Copy headers, excluding hop-by-hop headers
-            headers = {k: v for k, v in request.headers.items() 
-                      if k.lower() not in ('host', 'connection', 'keep-alive', 
-                                           'proxy-authenticate', 'proxy-authorization',
-                                           'te', 'trailers', 'transfer-encoding', 'upgrade')}
+            # Copy headers, excluding hop-by-hop headers (case-insensitive removal,
+            # and repeated headers are kept)
+            headers = request.headers.copy()
+            for name in HOP_BY_HOP_REQUEST_HEADERS:
+                headers.popall(name, None)
             
             # Make the proxied request
             async with self.session.request(
@@ -503,53 +600,51 @@ class ErrorProxy:
                 data=body,
                 allow_redirects=False
             ) as resp:
-                # Copy response headers
-                # For non-streaming responses, we need to exclude content-encoding and content-length
-                # because aiohttp.Response.read() automatically decompresses the body
-                response_headers = {k: v for k, v in resp.headers.items()
-                                   if k.lower() not in ('connection', 'keep-alive',
-                                                        'transfer-encoding', 'content-encoding',
-                                                        'content-length')}
-                
-                # Check if this is a streaming response (SSE)
+                # Copy response headers, excluding hop-by-hop headers (repeated
+                # headers such as Set-Cookie are kept)
+                # The body is passed through byte for byte (still encoded), so the
+                # provider's content-encoding and content-length stay valid
+                response_headers = resp.headers.copy()
+                for name in HOP_BY_HOP_RESPONSE_HEADERS:
+                    response_headers.popall(name, None)
+
+                # Check if this is a streaming response (SSE), for logging
                 content_type = resp.headers.get('content-type', '').lower()
-                is_streaming = 'text/event-stream' in content_type
-                
-                if is_streaming:
-                    # Stream the response (Server-Sent Events)
-                    logger.info(f"🌊 Streaming response: {resp.status}")
-                    response = StreamResponse(
-                        status=resp.status,
-                        headers=response_headers
-                    )
-                    await response.prepare(request)
-
-                    # Stream chunks from provider to client
-                    try:
-                        async for chunk in resp.content.iter_any():
-                            await response.write(chunk)
-                        await response.write_eof()
-                    except Exception as stream_error:
-                        logger.warning(f"Stream write error (client may have disconnected): {stream_error}")
-                    logger.info(f"Status: {self._format_status_line()}")
-                    return response
+                if 'text/event-stream' in content_type:
+                    logger.info("🌊 Streaming response: %d", resp.status)
                 else:
-                    # Non-streaming response - read entire body
-                    response_body = await resp.read()
-                    logger.info(f"✅ Proxied response: {resp.status}")
-                    logger.info(f"Status: {self._format_status_line()}")
-
-                    return Response(
-                        body=response_body,
-                        status=resp.status,
-                        headers=response_headers
-                    )
+                    logger.info("✅ Proxied response: %d", resp.status)
+
+                # Forward chunks as they arrive rather than buffering the whole body
+                response = StreamResponse(
+                    status=resp.status,
+                    headers=response_headers
+                )
+                await response.prepare(request)
+
+                try:
+                    async for chunk in resp.content.iter_chunked(65536):
+                        await response.write(chunk)
+                    await response.write_eof()
+                except asyncio.CancelledError:
+                    # The handler was cancelled (client went away): drop the
+                    # upstream connection now rather than draining the body
+                    resp.close()
+                    raise
+                except Exception as stream_error:
+                    logger.warning("Stream write error (client may have disconnected): %s", stream_error)
+                    resp.close()
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("Status: %s", self._format_status_line())
+                return response
                 
         except Exception as e:
-            logger.error(f"❌ Error proxying request: {e}", exc_info=True)
-            return web.json_response(
-                {'error': {'message': f'Proxy error: {str(e)}'}},
-                status=500
+            logger.error("❌ Error proxying request: %s", e, exc_info=True)
+            return Response(
+                body=encode_json({'error': {'message': f'Proxy error: {str(e)}'}}),
+                status=500,
+                content_type='application/json',
+                charset='utf-8'
             )
 
 
@@ -623,16 +718,10 @@ def parse_command(command: str) -> tuple[Optional[ErrorMode], int, float, Option
 def print_status(proxy: ErrorProxy):
     """Print the current proxy status."""
     mode, count, percentage = proxy.get_error_config()
-    mode_names = {
-        ErrorMode.NO_ERROR: "✅ No error (pass through)",
-        ErrorMode.CONTEXT_LENGTH: "📏 Context length exceeded",
-        ErrorMode.RATE_LIMIT: "⏱️  Rate limit exceeded",
-        ErrorMode.SERVER_ERROR: "💥 Server error (500)"
-    }
 
     print("\n" + "=" * 60)
-    mode_str = mode_names.get(mode, 'Unknown')
-    if mode != ErrorMode.NO_ERROR:
+    mode_str = MODE_NAMES[mode]
+    if mode is not ErrorMode.NO_ERROR:
         if percentage > 0.0:
             mode_str += f" ({percentage*100:.0f}% of requests)"
         elif count > 0:
@@ -640,17 +729,7 @@ def print_status(proxy: ErrorProxy):
     print(f"Current mode: {mode_str}")
     print(f"Requests handled: {proxy.request_count}")
     print("=" * 60)
-    print("\nCommands:")
-    print("  n      - No error (pass through) - permanent")
-    print("  c      - Context length exceeded (1 time)")
-    print("  c 4    - Context length exceeded (4 times)")
-    print("  c 0.3  - Context length exceeded (30% of requests)")
-    print("  c 30%  - Context length exceeded (30% of requests)")
-    print("  c *    - Context length exceeded (100% of requests)")
-    print("  r      - Rate limit error (1 time)")
-    print("  u      - Unknown server error (1 time)")
-    print("  q      - Quit")
-    print()
+    print(COMMANDS_HELP)
 
 
 def stdin_reader(proxy: ErrorProxy, loop):
@@ -674,8 +753,10 @@ def stdin_reader(proxy: ErrorProxy, loop):
                 print(f"❌ {error_msg}")
                 continue
 
-            # Set the error mode
-            proxy.set_error_mode(mode, count, percentage)
+            # Set the error mode on the event loop thread and wait for it to apply
+            asyncio.run_coroutine_threadsafe(
+                proxy.set_error_mode_async(mode, count, percentage), loop
+            ).result()
             print_status(proxy)
 
         except EOFError:
@@ -687,6 +768,75 @@ def stdin_reader(proxy: ErrorProxy, loop):
             logger.error(f"Error reading stdin: {e}")
 
 
+def add_stdin_reader(proxy: ErrorProxy, loop) -> bool:
+    """
+    Read commands from stdin on the event loop itself (no thread).
+
+    Returns:
+        False if stdin cannot be watched by the loop (e.g. on Windows, or when
+        stdin is a regular file), in which case the caller should fall back
+        to stdin_reader in a thread
+    """
+    fd = sys.stdin.fileno()
+    encoding = sys.stdin.encoding or 'utf-8'
+    pending = bytearray()
+
+    def run_command(command: str) -> bool:
+        """Apply one command line; returns False once shutdown has been requested."""
+        if command.lower() == 'q':
+            print("\n🛑 Shutting down proxy...")
+            loop.stop()
+            return False
+
+        # Parse the command using the shared parser
+        mode, count, percentage, error_msg = parse_command(command)
+
+        if error_msg:
+            print(f"❌ {error_msg}")
+        else:
+            # Already on the event loop thread, so no hand-off is needed
+            proxy.set_error_mode(mode, count, percentage)
+            print_status(proxy)
+        return True
+
+    def on_stdin_readable():
+        try:
+            data = os.read(fd, 4096)
+        except OSError as e:
+            logger.error("Error reading stdin: %s", e)
+            return
+
+        if data:
+            pending.extend(data)
+        else:
+            # Handle Ctrl+D, running any final line that had no newline
+            loop.remove_reader(fd)
+            if pending.strip() and not run_command(pending.decode(encoding, 'replace').strip()):
+                return
+            print("\n🛑 Shutting down proxy...")
+            loop.stop()
+            return
+
+        # Read raw bytes and split lines ourselves: a buffered readline() could
+        # pull several lines at once and leave the rest unseen by the loop
+        while (end := pending.find(b'\n')) >= 0:
+            command = pending[:end].decode(encoding, 'replace').strip()
+            del pending[:end + 1]
+            if not run_command(command):
+                loop.remove_reader(fd)
+                return
+        print("Enter command: ", end='', flush=True)
+
+    try:
+        loop.add_reader(fd, on_stdin_readable)
+    except (NotImplementedError, OSError):
+        return False
+
+    print_status(proxy)
+    print("Enter command: ", end='', flush=True)
+    return True
+
+
 async def shutdown_server(loop):
     """Shutdown the server gracefully."""
     # Stop the event loop
@@ -703,7 +853,12 @@ async def create_app(proxy: ErrorProxy) -> web.Application:
     Returns:
         Configured aiohttp application
     """
-    app = web.Application()
+    # Request bodies are streamed upstream, so don't cap their size, and keep
+    # idle client connections open as long as the upstream connector does
+    app = web.Application(
+        client_max_size=0,
+        handler_args={'keepalive_timeout': 120, 'tcp_keepalive': True},
+    )
     
     # Setup and teardown
     async def on_startup(app):
@@ -781,15 +936,11 @@ def main():
             print(f"  Count: {count}")
         print()
 
-    # Create event loop
-    loop = asyncio.new_event_loop()
+    # Create event loop (libuv-based when uvloop is installed)
+    loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
     asyncio.set_event_loop(loop)
 
-    # Start stdin reader thread only if not disabled
-    if not args.no_stdin:
-        stdin_thread = threading.Thread(target=stdin_reader, args=(proxy, loop), daemon=True)
-        stdin_thread.start()
-    else:
+    if args.no_stdin:
         print("Running in no-stdin mode (background/automated)")
         print("Use SIGINT (Ctrl+C) or SIGTERM to stop the proxy")
         print()
@@ -804,6 +955,14 @@ def main():
     loop.run_until_complete(site.start())
     
     logger.info(f"Proxy running on http://localhost:{args.port}")
+
+    # Start the stdin reader only if not disabled, falling back to a thread
+    # where the event loop cannot watch stdin. This happens once the server
+    # is up so an early 'q' cannot stop the loop mid-startup
+    if not args.no_stdin:
+        if not add_stdin_reader(proxy, loop):
+            stdin_thread = threading.Thread(target=stdin_reader, args=(proxy, loop), daemon=True)
+            stdin_thread.start()
     
     try:
         loop.run_forever()
@@ -8,99 +8,200 @@ Tests:
 2. session/new - Create a new session
 3. session/prompt - Send a prompt to the session
 4. session/load - Load an existing session (new feature)
+
+Set ACP_VERBOSE=0 to hide the raw JSON-RPC traffic.
 """
 
+import functools
 import subprocess
 import json
 import os
 import sys
 import time
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is used otherwise
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:  # optional lazy parser; every line is fully decoded otherwise
+    simdjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either
+json_loads = orjson.loads if orjson else json.loads
+
+
+def encode_json(data):
+    """Serialize data to UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson:
+        return orjson.dumps(data)
+    return json.dumps(data).encode('utf-8')
+
+
+@functools.lru_cache(maxsize=None)
+def request_prefix(method):
+    """Return the encoded start of a JSON-RPC request for method, up to the id value."""
+    return b'{"jsonrpc":"2.0","method":' + encode_json(method) + b',"id":'
+
+
+def session_update(message):
+    """Return the params.update object of a notification, or {} if it has none."""
+    try:
+        return message['params']['update']
+    except (KeyError, TypeError):
+        return {}
+
+
+def session_update_kind(message):
+    """Return the params.update.sessionUpdate field of a notification, or 'unknown'."""
+    try:
+        return message['params']['update']['sessionUpdate']
+    except (KeyError, TypeError):
+        return 'unknown'
+
 
 class AcpClient:
+    # initialize always sends the same params, so they are encoded only once
+    INITIALIZE_PARAMS_JSON = encode_json({
+        "protocolVersion": "v1",
+        "clientCapabilities": {},
+        "clientInfo": {
+            "name": "test-client",
+            "version": "1.0.0"
+        }
+    })
+
     def __init__(self):
         self.process = subprocess.Popen(
             ['cargo', 'run', '-p', 'goose-cli', '--', 'acp'],
             stdin=subprocess.PIPE,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            text=True,
-            bufsize=0
+            # Buffered pipes: readline() refills in 64 KiB blocks instead of
+            # reading a byte per syscall (requests are flushed explicitly)
+            bufsize=1 << 16
         )
+        self._stdin_fd = self.process.stdin.fileno()
         self.request_id = 0
-
-    def send_request(self, method, params=None, collect_notifications=False):
+        # Default working directory for new and loaded sessions
+        self.cwd = os.getcwd()
+        # Print every message sent and received (formatting is skipped when off)
+        self.verbose = os.environ.get('ACP_VERBOSE', '1') != '0'
+        # One simdjson parser for the whole session, so its buffers are reused
+        # across lines instead of reallocated per request
+        self._parser = simdjson.Parser() if simdjson else None
+
+    def send_request(self, method, params=None, on_notification=None):
         """Send a request and wait for the response.
 
         Args:
             method: The JSON-RPC method name
             params: Optional parameters for the request
-            collect_notifications: If True, collect notifications until response arrives
+            on_notification: Optional callback invoked with each notification
+                that arrives before the response
 
         Returns:
-            Tuple of (response, notifications) if collect_notifications is True,
-            otherwise just the response.
+            Tuple of (response, number of notifications received). Notifications
+            are only counted unless on_notification keeps them.
         """
-        self.request_id += 1
-        request = {
-            "jsonrpc": "2.0",
-            "method": method,
-            "id": self.request_id,
-        }
-        if params:
-            request["params"] = params
+        params_json = encode_json(params) if params else None
+        return self._send_raw(method, params_json, on_notification)
 
-        request_str = json.dumps(request)
-        print(f">>> Sending: {request_str}")
-        self.process.stdin.write(request_str + '\n')
-        self.process.stdin.flush()
+    def _send_raw(self, method, params_json=None, on_notification=None):
+        """Like send_request, but with params already encoded as JSON bytes."""
+        self.request_id += 1
 
-        notifications = []
+        # The pipes are binary: JSON goes out and comes back as UTF-8 bytes and
+        # is only decoded to str for display. The envelope up to the id is
+        # encoded once per method; only the id and params change per request
+        parts = [request_prefix(method), str(self.request_id).encode()]
+        if params_json is not None:
+            parts += (b',"params":', params_json)
+        parts.append(b'}')
+        if self.verbose:
+            print(f">>> Sending: {b''.join(parts).decode('utf-8')}")
+        parts.append(b'\n')
+        self._write_parts(parts)
+
+        return self._read_response(self.request_id, on_notification)
+
+    def _write_parts(self, parts):
+        """Write byte strings to the agent's stdin as one message."""
+        if not hasattr(os, 'writev'):  # Windows
+            self.process.stdin.write(b''.join(parts))
+            self.process.stdin.flush()
+            return
+
+        # Gather-write straight to the pipe in one syscall; nothing else writes
+        # through process.stdin, so its buffer is always empty here
+        written = os.writev(self._stdin_fd, parts)
+        remaining = sum(map(len, parts)) - written
+        if remaining:
+            rest = memoryview(b''.join(parts))[-remaining:]
+            while rest:
+                rest = rest[os.write(self._stdin_fd, rest):]
+
+    def _read_response(self, request_id, on_notification=None):
+        """Read messages until the response to request_id arrives.
+
+        Requests are sent one at a time, so anything else carrying an id (a
+        stale reply, or a request from the agent) is printed and skipped.
+        """
+        # With simdjson each line is parsed into a lazy proxy, so only the
+        # fields that are actually read become Python objects
+        parser = self._parser
+        # Notifications are only counted when nothing prints or keeps them
+        count_only = on_notification is None and not self.verbose
+        notification_count = 0
 
         # Read responses until we get one with our request ID
         while True:
+            # Release the previous line's proxy: the parser reuses its buffer
+            response = None
             response_line = self.process.stdout.readline()
             if not response_line:
-                if collect_notifications:
-                    return None, notifications
-                return None
+                return None, notification_count
 
-            response = json.loads(response_line)
+            # Every JSON-RPC response carries an "id" member, so a line without
+            # that text anywhere is a notification and needn't be parsed at all
+            if count_only and b'"id"' not in response_line:
+                notification_count += 1
+                continue
+
+            response = parser.parse(response_line) if parser else json_loads(response_line)
 
             # Check if this is a notification (has 'method' but no 'id')
             if 'method' in response and 'id' not in response:
-                print(f"<<< Notification: {response['method']}: {response.get('params', {}).get('update', {}).get('sessionUpdate', 'unknown')}")
-                if collect_notifications:
-                    notifications.append(response)
+                if self.verbose:
+                    print(f"<<< Notification: {response['method']}: {session_update_kind(response)}")
+                notification_count += 1
+                if on_notification:
+                    on_notification(response.as_dict() if parser else response)
                 continue
 
-            if response.get('id') == self.request_id:
-                print(f"<<< Response: {response_line.strip()}")
-                if collect_notifications:
-                    return response, notifications
-                return response
+            # Requests from the agent also carry an id, which may equal ours
+            if 'method' not in response and response.get('id') == request_id:
+                if self.verbose:
+                    print(f"<<< Response: {response_line.strip().decode('utf-8', errors='replace')}")
+                return (response.as_dict() if parser else response), notification_count
             else:
                 # Response for a different request ID, skip
-                print(f"<<< Unexpected response ID: {response}")
+                if self.verbose:
+                    print(f"<<< Unexpected response ID: {response.as_dict() if parser else response}")
 
     def initialize(self):
         """Initialize the ACP connection and verify capabilities."""
-        return self.send_request("initialize", {
-            "protocolVersion": "v1",
-            "clientCapabilities": {},
-            "clientInfo": {
-                "name": "test-client",
-                "version": "1.0.0"
-            }
-        })
+        response, _ = self._send_raw("initialize", self.INITIALIZE_PARAMS_JSON)
+        return response
 
     def new_session(self, cwd=None):
         """Create a new session (session/new)."""
-        params = {
-            "mcpServers": [],
-            "cwd": cwd or os.getcwd()
-        }
-        return self.send_request("session/new", params)
+        # Only the cwd varies, so it is the only part encoded per call
+        params_json = b'{"mcpServers":[],"cwd":' + encode_json(cwd or self.cwd) + b'}'
+        response, _ = self._send_raw("session/new", params_json)
+        return response
 
     def load_session(self, session_id, cwd=None):
         """Load an existing session (session/load).
@@ -110,24 +211,25 @@ class AcpClient:
         params = {
             "sessionId": session_id,
             "mcpServers": [],
-            "cwd": cwd or os.getcwd()
+            "cwd": cwd or self.cwd
         }
-        return self.send_request("session/load", params, collect_notifications=True)
+        notifications = []
+        response, _ = self.send_request("session/load", params, on_notification=notifications.append)
+        return response, notifications
 
     def prompt(self, session_id, text):
         """Send a prompt to the session (session/prompt).
 
-        Returns: (response, notifications) tuple with streaming notifications.
+        Returns: (response, notification_count) tuple; the streaming
+        notifications themselves are printed but not kept.
         """
-        return self.send_request("session/prompt", {
-            "sessionId": session_id,
-            "prompt": [
-                {
-                    "type": "text",
-                    "text": text
-                }
-            ]
-        }, collect_notifications=True)
+        # The params have a fixed shape: encode just the two strings (for
+        # escaping) and splice them into the surrounding bytes
+        params_json = b''.join((
+            b'{"sessionId":', encode_json(session_id),
+            b',"prompt":[{"type":"text","text":', encode_json(text), b'}]}',
+        ))
+        return self._send_raw("session/prompt", params_json)
 
     def close(self):
         if self.process:
@@ -165,7 +267,7 @@ def test_load_session(client, session_id):
     if notifications:
         print(f"   📝 Received {len(notifications)} notification(s) (session history replay):")
         for n in notifications:
-            update = n.get('params', {}).get('update', {})
+            update = session_update(n)
             update_type = update.get('sessionUpdate', 'unknown')
             content = update.get('content', {})
             if isinstance(content, dict):
@@ -211,9 +313,9 @@ def main():
             return 1
 
         print("\n3. Sending prompt (session/prompt)...")
-        prompt_response, notifications = client.prompt(session_id, "Hello! Say 'test successful' if you can hear me.")
-        if notifications:
-            print(f"   📝 Received {len(notifications)} streaming notification(s)")
+        prompt_response, notification_count = client.prompt(session_id, "Hello! Say 'test successful' if you can hear me.")
+        if notification_count:
+            print(f"   📝 Received {notification_count} streaming notification(s)")
         if prompt_response and 'result' in prompt_response:
             print(f"   ✓ Got response: {prompt_response['result']}")
         elif prompt_response and 'error' in prompt_response:
@@ -240,9 +342,9 @@ def main():
             return 1
 
         print("\n6. Sending prompt to loaded session...")
-        prompt_response, notifications = client.prompt(session_id, "What was my previous message?")
-        if notifications:
-            print(f"   📝 Received {len(notifications)} streaming notification(s)")
+        prompt_response, notification_count = client.prompt(session_id, "What was my previous message?")
+        if notification_count:
+            print(f"   📝 Received {notification_count} streaming notification(s)")
         if prompt_response and 'result' in prompt_response:
             print(f"   ✓ Got response: {prompt_response['result']}")
         elif prompt_response and 'error' in prompt_response: